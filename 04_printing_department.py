@@ -2,20 +2,12 @@ from aoc import Coord, Grid, Input, run, TestCase
 
 
 def parse(args):
-    return Input(args).as_grid()
-
-
-def count_adjacent_rolls(grid, position):
-    neighbors = position.neighbors(grid.max_bounds, directions=Coord.DIRECTIONS_ALL)
-    return sum(1 for neighbor in neighbors if grid[neighbor] == "@")
-
-
-def is_removable(grid, position):
-    return grid[position] == "@" and count_adjacent_rolls(grid, position) < 4
+    return Input(args).as_grid(compact=True)
 
 
 def find_removable_rolls(grid):
-    return {pos for pos, _ in grid.coords() if is_removable(grid, pos)}
+    counts = grid.count_neighbors("@", Coord.DIRECTIONS_ALL)
+    return {pos for pos in grid.find_all("@") if counts[pos] < 4}
 
 
 def count_accessible_rolls(args):
@@ -25,14 +17,8 @@ def count_accessible_rolls(args):
 
 def count_total_removable_rolls(args):
     grid = parse(args)
-    total_removed = 0
-
-    while removable := find_removable_rolls(grid):
-        for pos in removable:
-            grid[pos] = "."
-        total_removed += len(removable)
-
-    return total_removed
+    removed = grid.erode("@", ".", lambda count: count < 4, Coord.DIRECTIONS_ALL)
+    return len(removed)
 
 
 if __name__ == "__main__":
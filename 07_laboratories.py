@@ -13,15 +13,14 @@ class BeamData(NamedTuple):
 
 
 def parse(args: str) -> BeamData:
-    grid = Input(args).as_grid()
+    grid = Input(args).as_grid(compact=True)
     start = grid.find_first(START)
     if start is None:
         raise ValueError(f"No start position '{START}' found in grid")
 
     splitters_by_row = defaultdict(set)
-    for coord, value in grid.coords():
-        if value == SPLITTER:
-            splitters_by_row[coord.row].add(coord.col)
+    for coord in grid.find_all(SPLITTER):
+        splitters_by_row[coord.row].add(coord.col)
 
     return BeamData(grid, start, splitters_by_row)
 
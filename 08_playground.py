@@ -2,8 +2,8 @@ import heapq
 import math
 from typing import NamedTuple
 
-from aoc import Input, run, TestCase, UnionFind
-from aoc.d3 import Coord
+from aoc import Input, run, TestCase, UnionFind, kruskal
+from aoc.d3 import Coord, KDTree, PointCloud
 
 
 class Edge(NamedTuple):
@@ -22,14 +22,9 @@ def parse(data_file: str) -> list[Coord]:
     return [Coord(*line) for line in lines]
 
 
-def compute_distances(coords: list[Coord]) -> list[Edge]:
-    n = len(coords)
-
-    return sorted(
-        Edge(coords[i].squared_distance(coords[j]), i, j)
-        for i in range(n)
-        for j in range(i + 1, n)
-    )
+def nearest_edges(coords: list[Coord], count: int) -> list[Edge]:
+    cloud = PointCloud.from_coords(coords)
+    return [Edge(*edge) for edge in cloud.nearest_pairs(count)]
 
 
 def product_of_three_largest(sizes: list[int]) -> int:
@@ -45,26 +40,21 @@ def build_connected_components(
     return uf
 
 
-def find_final_connecting_edge(coords: list[Coord], distances: list[Edge]) -> CoordPair:
-    uf = UnionFind(len(coords))
-    return next(
-        CoordPair(coords[i], coords[j])
-        for _, i, j in distances
-        if uf.union(i, j) and uf.count_components() == 1
-    )
+def find_final_connecting_edge(coords: list[Coord]) -> CoordPair:
+    _, (_, i, j) = kruskal(len(coords), KDTree(coords).closest_pairs())
+    return CoordPair(coords[i], coords[j])
 
 
 def three_largest_circuits(data_file: str, num_connections: int) -> int:
     coords = parse(data_file)
-    distances = compute_distances(coords)
+    distances = nearest_edges(coords, num_connections)
     uf = build_connected_components(len(coords), distances, num_connections)
     return product_of_three_largest(uf.get_component_sizes())
 
 
 def last_connection_product(data_file: str) -> int:
     coords = parse(data_file)
-    distances = compute_distances(coords)
-    pair = find_final_connecting_edge(coords, distances)
+    pair = find_final_connecting_edge(coords)
     return pair.a.x * pair.b.x
 
 
@@ -1,5 +1,5 @@
 from aoc import Input, run, TestCase
-from aoc.graph import count_paths_dag
+from aoc.graph import CompactGraph, count_paths_via
 
 
 def parse(args):
@@ -7,24 +7,29 @@ def parse(args):
     return dict(pairs)
 
 
-def count_paths(graph, current, target, visited):
+def parse_graph(args) -> CompactGraph:
+    return CompactGraph.from_adjacency(parse(args))
+
+
+def count_paths(graph: CompactGraph, current: int, target: int, visited: bytearray):
     if current == target:
         return 1
 
-    if current in visited or current not in graph:
+    if visited[current]:
         return 0
 
-    visited.add(current)
+    visited[current] = 1
     total = sum(
-        count_paths(graph, neighbor, target, visited) for neighbor in graph[current]
+        count_paths(graph, neighbor, target, visited)
+        for neighbor in graph.neighbors(current)
     )
-    visited.remove(current)
+    visited[current] = 0
     return total
 
 
 def count_all_paths_out(args):
-    graph = parse(args)
-    return count_paths(graph, "you", "out", set())
+    graph = parse_graph(args)
+    return count_paths(graph, graph.id("you"), graph.id("out"), bytearray(len(graph)))
 
 
 def count_paths_visiting_dac_and_fft(args):
@@ -33,21 +38,7 @@ def count_paths_visiting_dac_and_fft(args):
     def neighbors(node):
         return graph.get(node, [])
 
-    # Multiplicative counting: svr → fft → dac → out
-    paths_fft_then_dac = (
-        count_paths_dag("svr", "fft", neighbors)
-        * count_paths_dag("fft", "dac", neighbors)
-        * count_paths_dag("dac", "out", neighbors)
-    )
-
-    # Multiplicative counting: svr → dac → fft → out
-    paths_dac_then_fft = (
-        count_paths_dag("svr", "dac", neighbors)
-        * count_paths_dag("dac", "fft", neighbors)
-        * count_paths_dag("fft", "out", neighbors)
-    )
-
-    return paths_fft_then_dac + paths_dac_then_fft
+    return count_paths_via("svr", "out", ["dac", "fft"], neighbors)
 
 
 if __name__ == "__main__":
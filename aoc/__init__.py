@@ -4,6 +4,8 @@ Advent of Code 2024 Utilities
 Organized into modules but accessible from top level for convenience:
 - d2: 2D coordinate and grid operations
 - d3: 3D coordinate and grid operations (explicit import required)
+- compress: Coordinate compression for sparse geometry (explicit import required)
+- geometry: Rectilinear polygon and point-set geometry (explicit import required)
 - graph: Graph algorithms (BFS, DFS, Dijkstra, max clique)
 - input: Data reading and parsing (Input and Parser classes)
 - math: Number/math utilities
@@ -34,14 +36,31 @@ __all__ = [
     "Dimension",
     "filter_coords_in_bounds",
     "Grid",
+    "ArrayGrid",
+    "BitGrid",
+    "SparseGrid",
     # From graph
     "bfs",
+    "bfs_multi",
+    "bfs_layers",
+    "bfs_indexed",
+    "bidirectional_bfs",
     "dfs",
     "bfs_grid_path",
     "dfs_grid_path",
+    "bfs_padded_path",
+    "flood_fill_padded",
     "dijkstra",
+    "dijkstra_buckets",
+    "bfs_01",
+    "astar",
+    "manhattan_heuristic",
+    "chebyshev_heuristic",
     "find_max_clique",
+    "heap_ordered",
+    "kruskal",
     "UnionFind",
+    "CompactGraph",
     # From input
     "Input",
     "Parser",
@@ -0,0 +1,226 @@
+"""
+Coordinate compression for large, sparse 2D geometry.
+
+Owns the compress -> geometry dependency (fill_polygon for compressed
+polygons); geometry must not import this module.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
+import itertools
+from typing import Any, Iterable
+
+from .d2 import ArrayGrid, Coord, Dimension, Grid
+from .geometry import fill_polygon
+
+
+@dataclass(frozen=True)
+class CompressedAxis:
+    """
+    Sorted positions along one axis of a compressed coordinate space.
+
+    Compressed cell i covers real coordinates values[i] .. values[i] + spans[i] - 1.
+    With gaps, the empty stretch between two input values gets its own cell,
+    so spans add up to the full real extent and areas can be recovered.
+
+    Example:
+        >>> axis = compress_axis([2, 7, 9, 11])
+        >>> axis.values, axis.spans
+        ([2, 3, 7, 8, 9, 10, 11], [1, 4, 1, 1, 1, 1, 1])
+        >>> axis.index(9), axis.locate(5)
+        (4, 1)
+    """
+
+    values: list[int]
+    spans: list[int]
+
+    def __len__(self) -> int:
+        """Number of compressed cells."""
+        return len(self.values)
+
+    def index(self, value: int) -> int:
+        """
+        Compressed index of an exact input value (binary search).
+
+        Raises:
+            KeyError: If value is not one of the axis positions
+        """
+        i = bisect_left(self.values, value)
+        if i == len(self.values) or self.values[i] != value:
+            raise KeyError(value)
+        return i
+
+    def locate(self, value: int) -> int:
+        """
+        Compressed index of the cell containing an arbitrary real coordinate.
+
+        Raises:
+            KeyError: If value lies outside the axis extent
+        """
+        i = bisect_right(self.values, value) - 1
+        if i < 0 or value >= self.values[i] + self.spans[i]:
+            raise KeyError(value)
+        return i
+
+
+def compress_axis(values: Iterable[int], gaps: bool = True) -> CompressedAxis:
+    """
+    Compress real coordinates along one axis.
+
+    Args:
+        values: Real coordinates (duplicates allowed, any order)
+        gaps: Insert a cell for each empty stretch between values (default: True)
+
+    Returns:
+        CompressedAxis with sorted positions and real-world spans
+    """
+    unique = sorted(set(values))
+    if not gaps:
+        return CompressedAxis(unique, [1] * len(unique))
+
+    positions = []
+    for a, b in zip(unique, unique[1:]):
+        positions.append(a)
+        if b - a > 1:
+            positions.append(a + 1)
+    positions.extend(unique[-1:])
+
+    spans = [b - a for a, b in zip(positions, positions[1:])] + [1] * bool(positions)
+    return CompressedAxis(positions, spans)
+
+
+@dataclass(frozen=True)
+class CompressedPlane:
+    """
+    2D compressed coordinate space built from a point set.
+
+    Maps real coordinates to compact cell coordinates and back, rasterizes
+    rectilinear paths into a compact grid, and weighs compressed cells by
+    their real width × height.
+
+    Example:
+        >>> plane = compress_points([Coord(7, 1), Coord(11, 1), Coord(11, 7), Coord(7, 7)])
+        >>> plane.size
+        Dimension(width=3, height=3)
+        >>> grid = plane.rasterize([Coord(7, 1), Coord(11, 1), Coord(11, 7), Coord(7, 7)])
+        >>> plane.area(grid, {'#'})  # 5 × 7 outline of a 3 × 5 hole
+        20
+    """
+
+    xs: CompressedAxis
+    ys: CompressedAxis
+
+    @property
+    def size(self) -> Dimension:
+        """Size of the compressed grid as Dimension(width, height)."""
+        return Dimension(len(self.xs), len(self.ys))
+
+    def compress(self, coord: Coord) -> Coord:
+        """Compressed coordinate of an input point."""
+        return Coord(self.xs.index(coord.x), self.ys.index(coord.y))
+
+    def locate(self, coord: Coord) -> Coord:
+        """Compressed cell containing an arbitrary real coordinate."""
+        return Coord(self.xs.locate(coord.x), self.ys.locate(coord.y))
+
+    def expand(self, coord: Coord) -> Coord:
+        """Real coordinate of a compressed cell's top-left corner."""
+        return Coord(self.xs.values[coord.x], self.ys.values[coord.y])
+
+    def cell_area(self, coord: Coord) -> int:
+        """Real-world number of unit cells covered by a compressed cell."""
+        return self.xs.spans[coord.x] * self.ys.spans[coord.y]
+
+    def rasterize(
+        self,
+        path: list[Coord],
+        closed: bool = True,
+        value: Any = "#",
+        empty: Any = ".",
+        interior: Any | None = None,
+    ) -> ArrayGrid:
+        """
+        Draw a rectilinear polyline into a compact grid.
+
+        Args:
+            path: Real-coordinate vertices (each consecutive pair axis-aligned)
+            closed: Also draw the segment from the last vertex back to the first
+            value: Cell value for path cells (default: '#')
+            empty: Cell value everywhere else (default: '.')
+            interior: If given, fill the inside of the closed path with this
+                value using fill_polygon's scanline sweep (default: None)
+
+        Returns:
+            ArrayGrid of size self.size with the path drawn in
+
+        Raises:
+            ValueError: If a segment is not horizontal or vertical
+        """
+        grid = ArrayGrid.create(self.size, empty)
+        points = [self.compress(p) for p in path]
+        if interior is not None:
+            fill_polygon(grid, points, interior)
+        if closed and points:
+            points.append(points[0])
+
+        for a, b in zip(points, points[1:]):
+            if a.x != b.x and a.y != b.y:
+                raise ValueError(
+                    f"Segment {self.expand(a)} -> {self.expand(b)} is not axis-aligned"
+                )
+            grid.fill_rect(a, b, value)
+        if len(points) == 1:
+            grid[points[0]] = value
+        return grid
+
+    def area(self, grid: Grid, values: set[Any]) -> int:
+        """
+        Real-world area of compressed cells whose value is in values.
+
+        Args:
+            grid: Compressed grid of size self.size
+            values: Cell values to count
+
+        Returns:
+            Sum of width × height over matching cells
+        """
+        width = len(self.xs)
+        mask = grid.mask(values)
+        total = 0
+        for r, row_span in enumerate(self.ys.spans):
+            row = mask[r * width : (r + 1) * width]
+            total += row_span * sum(itertools.compress(self.xs.spans, row))
+        return total
+
+
+def compress_points(points: Iterable[Coord], gaps: bool = True) -> CompressedPlane:
+    """
+    Compress a 2D point set into sorted x and y axes.
+
+    Args:
+        points: Real coordinates
+        gaps: Insert cells for the empty stretches between points (default: True)
+
+    Returns:
+        CompressedPlane for the point set
+
+    Example:
+        >>> plane = compress_points([Coord(2, 5), Coord(1_000_000_000, 5)])
+        >>> plane.compress(Coord(1_000_000_000, 5))
+        Coord(x=2, y=0)
+    """
+    points = list(points)
+    return CompressedPlane(
+        compress_axis((p.x for p in points), gaps),
+        compress_axis((p.y for p in points), gaps),
+    )
+
+
+__all__ = [
+    "CompressedAxis",
+    "CompressedPlane",
+    "compress_axis",
+    "compress_points",
+]
@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Any, ClassVar, Iterator
+from array import array
+from collections import deque
+from dataclasses import dataclass, field
+from itertools import accumulate, compress
+from typing import Any, Callable, ClassVar, Iterator
 
 
 @dataclass(frozen=True)
@@ -64,6 +67,10 @@ class Coord:
         """Calculate Manhattan distance to another coordinate."""
         return abs(self.row - other.row) + abs(self.col - other.col)
 
+    def chebyshev_distance(self, other: Coord) -> int:
+        """Calculate Chebyshev (king-move) distance to another coordinate."""
+        return max(abs(self.row - other.row), abs(self.col - other.col))
+
     def squared_distance(self, other: Coord) -> int:
         return (self.row - other.row) ** 2 + (self.col - other.col) ** 2
 
@@ -130,6 +137,29 @@ Coord.TURN_COUNTER_CLOCKWISE = {
 }
 
 
+def neighbor_offsets(width: int, directions: list[Coord]) -> list[tuple[int, int]]:
+    """
+    Flat-index steps for moving in each direction on a row-major grid.
+
+    Cell i = row * width + col moves in direction d to i + d.y * width + d.x.
+    The step is valid when 0 <= col + d.x < width (so it does not wrap to
+    another row) and the target index lies in 0..cells-1. Only one entry per
+    direction is stored, so the cost is independent of the grid's size.
+
+    Args:
+        width: Grid width (row stride)
+        directions: Direction vectors (e.g. Coord.DIRECTIONS_CARDINAL)
+
+    Returns:
+        List of (flat_offset, dx) pairs, one per direction
+
+    Example:
+        >>> neighbor_offsets(10, [Coord.UP, Coord.RIGHT])
+        [(-10, 0), (1, 1)]
+    """
+    return [(d.y * width + d.x, d.x) for d in directions]
+
+
 def filter_coords_in_bounds(
     coords: list[Coord], max_bounds: Coord, min_bounds: Coord | None = None
 ) -> list[Coord]:
@@ -137,6 +167,80 @@ def filter_coords_in_bounds(
     return [c for c in coords if c.in_bounds(max_bounds, min_bounds)]
 
 
+@dataclass(frozen=True)
+class SummedAreaTable:
+    """
+    2D prefix sums over a grid mask for O(1) rectangle counts.
+
+    sums[r * (width + 1) + c] holds the number of matching cells with
+    row < r and col < c. Build one with Grid.prefix_sums(predicate).
+
+    Example:
+        >>> grid = Grid([['#', '.'], ['#', '#']])
+        >>> table = grid.prefix_sums(lambda v: v == '#')
+        >>> table.count(Coord(0, 0), Coord(1, 1))
+        3
+        >>> table.count_many([0, 1], [0, 0], [0, 1], [1, 0])
+        [2, 0]
+    """
+
+    sums: array
+    width: int
+    height: int
+
+    def count(self, corner_a: Coord, corner_b: Coord) -> int:
+        """
+        Count matching cells in the inclusive rectangle spanned by two corners.
+
+        Args:
+            corner_a: Any corner of the rectangle
+            corner_b: The opposite corner
+
+        Returns:
+            Number of matching cells inside the rectangle
+        """
+        x1, x2 = sorted((corner_a.x, corner_b.x))
+        y1, y2 = sorted((corner_a.y, corner_b.y))
+        stride, sums = self.width + 1, self.sums
+        top, bottom = y1 * stride, (y2 + 1) * stride
+        return (
+            sums[bottom + x2 + 1]
+            - sums[top + x2 + 1]
+            - sums[bottom + x1]
+            + sums[top + x1]
+        )
+
+    def count_many(
+        self,
+        min_xs: list[int],
+        min_ys: list[int],
+        max_xs: list[int],
+        max_ys: list[int],
+    ) -> list[int]:
+        """
+        Count matching cells for a batch of inclusive rectangles.
+
+        Rectangle i spans (min_xs[i], min_ys[i])..(max_xs[i], max_ys[i]);
+        the minimums must not exceed the maximums.
+
+        Returns:
+            List of counts, one per rectangle
+        """
+        stride, sums = self.width + 1, self.sums
+        return [
+            sums[(y2 + 1) * stride + x2 + 1]
+            - sums[y1 * stride + x2 + 1]
+            - sums[(y2 + 1) * stride + x1]
+            + sums[y1 * stride + x1]
+            for x1, y1, x2, y2 in zip(min_xs, min_ys, max_xs, max_ys)
+        ]
+
+    @property
+    def total(self) -> int:
+        """Number of matching cells in the whole grid."""
+        return self.sums[-1]
+
+
 @dataclass
 class Grid:
     """
@@ -149,6 +253,12 @@ class Grid:
     """
 
     data: list[list[Any]]
+    _index: dict[Any, set[Coord]] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _tracked: frozenset[Any] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def __getitem__(self, coord: Coord) -> Any:
         """Access grid value using coordinate: grid[coord]."""
@@ -156,11 +266,69 @@ class Grid:
 
     def __setitem__(self, coord: Coord, value: Any) -> None:
         """Set grid value using coordinate: grid[coord] = value."""
+        if self._index is not None:
+            self._reindex(coord, self[coord], value)
         self.data[coord.row][coord.col] = value
 
+    def build_index(self, values: set[Any] | None = None) -> Grid:
+        """
+        Build a value -> coordinates index, kept in sync by grid[coord] = value.
+
+        Once built, find_first and find_all for tracked values cost O(result)
+        instead of a full grid scan; other values fall back to the scan.
+        Track only the sparse values that are searched repeatedly: indexing
+        the background stores a Coord for almost every cell. Writes that
+        bypass __setitem__ (e.g. editing grid.data directly) are not tracked.
+
+        Args:
+            values: Values to track (default: every value, which also makes
+                group_by_value O(result))
+
+        Returns:
+            The grid itself, for chaining
+
+        Example:
+            >>> grid = Grid([['.', '^'], ['^', '.']]).build_index({'^'})
+            >>> grid.find_all('^')
+            [Coord(x=1, y=0), Coord(x=0, y=1)]
+        """
+        self._index = None
+        if values is None:
+            index = {}
+            for coord, value in self.coords():
+                index.setdefault(value, set()).add(coord)
+            self._tracked = None
+        else:
+            self._tracked = frozenset(values)
+            index = {value: set(self.find_all(value)) for value in self._tracked}
+        self._index = index
+        return self
+
+    def _is_indexed(self, value: Any) -> bool:
+        """True if searches for value can be answered from the index."""
+        return self._index is not None and (
+            self._tracked is None or value in self._tracked
+        )
+
+    def _reindex(self, coord: Coord, old: Any, new: Any) -> None:
+        """Move coord from old to new value in the index."""
+        if old == new:
+            return
+        positions = self._index.get(old)
+        if positions is not None:
+            positions.discard(coord)
+            if not positions and self._tracked is None:
+                del self._index[old]
+        if self._tracked is None or new in self._tracked:
+            self._index.setdefault(new, set()).add(coord)
+
+    def _indexed(self, value: Any) -> list[Coord]:
+        """Indexed positions of value in row-major order."""
+        return sorted(self._index.get(value, ()), key=lambda c: (c.y, c.x))
+
     def __contains__(self, coord: Coord) -> bool:
         """Check if coordinate is within bounds: coord in grid."""
-        return coord.in_bounds(self.max_bounds)
+        return 0 <= coord.y < len(self.data) and 0 <= coord.x < len(self.data[0])
 
     @property
     def size(self) -> Dimension:
@@ -188,6 +356,9 @@ class Grid:
 
     def find_first(self, value: Any) -> Coord | None:
         """Find first occurrence of value in grid, return coordinate or None."""
+        if self._is_indexed(value):
+            positions = self._index.get(value)
+            return min(positions, key=lambda c: (c.y, c.x)) if positions else None
         for coord, cell_value in self.coords():
             if cell_value == value:
                 return coord
@@ -195,6 +366,8 @@ class Grid:
 
     def find_all(self, value: Any) -> list[Coord]:
         """Find all occurrences of value in grid, return list of coordinates."""
+        if self._is_indexed(value):
+            return self._indexed(value)
         return [coord for coord, cell_value in self.coords() if cell_value == value]
 
     def group_by_value(self, exclude: Any | None = None) -> dict[Any, list[Coord]]:
@@ -207,12 +380,316 @@ class Grid:
         Returns:
             Dictionary mapping values to lists of coordinates with that value
         """
+        if self._index is not None and self._tracked is None:
+            return {
+                value: self._indexed(value) for value in self._index if value != exclude
+            }
         result = {}
         for coord, value in self.coords():
             if value != exclude:
                 result.setdefault(value, []).append(coord)
         return result
 
+    def index(self, coord: Coord) -> int:
+        """Convert coordinate to flat row-major index."""
+        return coord.y * self.size.width + coord.x
+
+    def coord_at(self, index: int) -> Coord:
+        """Convert flat row-major index back to coordinate."""
+        row, col = divmod(index, self.size.width)
+        return Coord(col, row)
+
+    def mask(self, values: set[Any]) -> bytearray:
+        """
+        Flat row-major mask with 1 where the cell value is in values.
+
+        Args:
+            values: Set of cell values to mark
+
+        Returns:
+            bytearray of length width * height, indexed like grid.index(coord)
+        """
+        return bytearray(v in values for row in self.data for v in row)
+
+    def _predicate_mask(self, predicate: Callable[[Any], bool]) -> bytearray:
+        """Flat row-major mask with 1 where predicate(value) is true."""
+        return bytearray(bool(predicate(v)) for row in self.data for v in row)
+
+    def prefix_sums(self, predicate: Callable[[Any], bool]) -> SummedAreaTable:
+        """
+        Build a summed-area table counting cells where predicate(value) is true.
+
+        Args:
+            predicate: Function deciding whether a cell value is counted
+
+        Returns:
+            SummedAreaTable answering rectangle counts in O(1)
+
+        Example:
+            >>> outside = grid.prefix_sums(lambda v: v == '.')
+            >>> outside.count(corner_a, corner_b) == 0  # rectangle fully filled
+        """
+        size = self.size
+        width, height = size.width, size.height
+        mask = self._predicate_mask(predicate)
+
+        stride = width + 1
+        sums = array("q", [0]) * (stride * (height + 1))
+        previous = [0] * stride
+        for r in range(height):
+            row = mask[r * width : (r + 1) * width]
+            current = [a + b for a, b in zip(previous, accumulate(row, initial=0))]
+            sums[(r + 1) * stride : (r + 2) * stride] = array("q", current)
+            previous = current
+        return SummedAreaTable(sums, width, height)
+
+    def neighbor_offsets(
+        self, directions: list[Coord] | None = None
+    ) -> list[tuple[int, int]]:
+        """
+        Flat-index steps for this grid's width; see neighbor_offsets().
+        """
+        return neighbor_offsets(
+            self.size.width, directions or Coord.DIRECTIONS_CARDINAL
+        )
+
+    def count_neighbors(
+        self, value: Any, directions: list[Coord] | None = None
+    ) -> ArrayGrid:
+        """
+        Count, for every cell, how many neighbors equal value.
+
+        Each row mask is packed into an int with one byte per cell, so adding
+        shifted rows sums a whole row at once. Byte lanes never carry because
+        a count is at most len(directions).
+
+        Args:
+            value: Cell value to count
+            directions: Direction vectors to use (default: DIRECTIONS_CARDINAL)
+
+        Returns:
+            ArrayGrid of the same size holding neighbor counts
+
+        Example:
+            >>> grid = Grid([['@', '@'], ['.', '@']])
+            >>> counts = grid.count_neighbors('@', Coord.DIRECTIONS_ALL)
+            >>> counts[Coord(0, 1)]
+            3
+        """
+        directions = directions or Coord.DIRECTIONS_CARDINAL
+        if len(directions) > 0xFF:
+            raise ValueError("At most 255 directions are supported")
+
+        size = self.size
+        width, height = size.width, size.height
+        full = (1 << (8 * width)) - 1
+        mask = self.mask({value})
+        rows = [
+            int.from_bytes(mask[start : start + width], "little")
+            for start in range(0, len(mask), width or 1)
+        ]
+
+        counts = bytearray()
+        for r in range(height):
+            total = 0
+            for d in directions:
+                source = r + d.y
+                if 0 <= source < height:
+                    bits = rows[source]
+                    if d.x >= 0:
+                        total += bits >> (8 * d.x)
+                    else:
+                        total += (bits << (-8 * d.x)) & full
+            counts += total.to_bytes(width, "little")
+
+        return ArrayGrid(array("B", counts), width)
+
+    def erode(
+        self,
+        value: Any,
+        replacement: Any,
+        should_remove: Callable[[int], bool],
+        directions: list[Coord] | None = None,
+    ) -> list[Coord]:
+        """
+        Repeatedly remove cells equal to value until the grid is stable.
+
+        A cell is removed when should_remove(neighbor_count) is true, where
+        neighbor_count is the number of neighbors that still equal value.
+        Neighbor counts are kept per cell and only the neighbors of a removed
+        cell are re-checked, so total work is O(cells + removals) rather than
+        a full rescan per round. Modifies the grid in-place.
+
+        Args:
+            value: Cell value that can be eroded
+            replacement: Value written into removed cells
+            should_remove: Predicate on a cell's current neighbor count
+            directions: Direction vectors to use (default: DIRECTIONS_CARDINAL)
+
+        Returns:
+            Coordinates removed, in removal order
+
+        Example:
+            >>> grid = Grid([['@', '@', '@'], ['@', '@', '@']])
+            >>> removed = grid.erode('@', '.', lambda n: n < 4, Coord.DIRECTIONS_ALL)
+            >>> len(removed)
+            6
+        """
+        directions = directions or Coord.DIRECTIONS_CARDINAL
+        size = self.size
+        width, height = size.width, size.height
+
+        counts = self.count_neighbors(value, directions).data
+        alive = self.mask({value})
+        queued = bytearray(len(alive))
+        queue = deque()
+        for i, cell in enumerate(alive):
+            if cell and should_remove(counts[i]):
+                queued[i] = 1
+                queue.append(i)
+
+        offsets = [(d.x, d.y) for d in directions]
+        removed = []
+        while queue:
+            i = queue.popleft()
+            queued[i] = 0
+            if not should_remove(counts[i]):
+                continue
+
+            alive[i] = 0
+            r, c = divmod(i, width)
+            removed.append(Coord(c, r))
+
+            # Cells that counted i as a neighbor sit at i - direction
+            for dx, dy in offsets:
+                nr, nc = r - dy, c - dx
+                if 0 <= nr < height and 0 <= nc < width:
+                    j = nr * width + nc
+                    if alive[j]:
+                        counts[j] -= 1
+                        if not queued[j] and should_remove(counts[j]):
+                            queued[j] = 1
+                            queue.append(j)
+
+        for coord in removed:
+            self[coord] = replacement
+        return removed
+
+    def distance_transform(
+        self,
+        source_values: set[Any],
+        directions: list[Coord] | None = None,
+        passable_values: set[Any] | None = None,
+    ) -> ArrayGrid:
+        """
+        Steps from every cell to its nearest source cell, in one multi-source BFS.
+
+        All source cells start in the first frontier at distance 0, so the
+        cost is O(cells × directions) no matter how many sources there are.
+        Runs over flat indices with per-direction offsets.
+
+        Args:
+            source_values: Cell values that count as sources
+            directions: Direction vectors to use (default: DIRECTIONS_CARDINAL)
+            passable_values: Values that may be stepped through (default: all)
+
+        Returns:
+            ArrayGrid of distances, -1 where no source is reachable
+
+        Example:
+            >>> grid = Grid([['#', '.', '.'], ['.', '.', '#']])
+            >>> distances = grid.distance_transform({'#'})
+            >>> list(distances.data)
+            [0, 1, 1, 1, 1, 0]
+        """
+        width = self.size.width
+        steps = self.neighbor_offsets(directions)
+        sources = self.mask(set(source_values))
+        passable = (
+            self.mask(set(passable_values)) if passable_values is not None else None
+        )
+
+        n = len(sources)
+        distances = array("q", [-1]) * n
+        frontier = list(compress(range(n), sources))
+        for i in frontier:
+            distances[i] = 0
+
+        dist = 0
+        while frontier:
+            dist += 1
+            next_frontier = []
+            for i in frontier:
+                col = i % width
+                for offset, dx in steps:
+                    if not 0 <= col + dx < width:
+                        continue
+                    j = i + offset
+                    if (
+                        0 <= j < n
+                        and distances[j] < 0
+                        and (passable is None or passable[j])
+                    ):
+                        distances[j] = dist
+                        next_frontier.append(j)
+            frontier = next_frontier
+
+        return ArrayGrid(distances, width)
+
+    def fill_rect(self, corner_a: Coord, corner_b: Coord, value: Any) -> None:
+        """
+        Set every cell in the inclusive rectangle spanned by two corners.
+
+        Writes whole row slices at a time; a line is a rectangle one cell wide.
+
+        Args:
+            corner_a: Any corner of the rectangle
+            corner_b: The opposite corner
+            value: Value to write
+
+        Raises:
+            IndexError: If either corner is outside the grid
+        """
+        if corner_a not in self or corner_b not in self:
+            raise IndexError(f"Rectangle {corner_a}..{corner_b} is outside the grid")
+        x1, x2 = sorted((corner_a.x, corner_b.x))
+        y1, y2 = sorted((corner_a.y, corner_b.y))
+        if self._index is not None:
+            for y in range(y1, y2 + 1):
+                for x in range(x1, x2 + 1):
+                    self[Coord(x, y)] = value
+            return
+        self._fill_rows(x1, x2, y1, y2, value)
+
+    def _fill_rows(self, x1: int, x2: int, y1: int, y2: int, value: Any) -> None:
+        """Slice-assign value into columns x1..x2 of rows y1..y2."""
+        span = [value] * (x2 - x1 + 1)
+        for y in range(y1, y2 + 1):
+            self.data[y][x1 : x2 + 1] = span
+
+    def padded(self, sentinel: Any) -> Grid:
+        """
+        Copy of the grid surrounded by a one-cell border of sentinel.
+
+        With a non-walkable sentinel every neighbor of an interior cell is
+        inside the grid, so searches can skip bounds checks entirely (see
+        bfs_padded_path / flood_fill_padded). Coordinates shift by (1, 1).
+
+        Args:
+            sentinel: Border value (must not be walkable in later searches)
+
+        Returns:
+            Grid of size (width + 2, height + 2)
+
+        Example:
+            >>> Grid([['.']]).padded('#').data
+            [['#', '#', '#'], ['#', '.', '#'], ['#', '#', '#']]
+        """
+        border = [sentinel] * (self.size.width + 2)
+        return Grid(
+            [border] + [[sentinel, *row, sentinel] for row in self.data] + [border[:]]
+        )
+
     def search_in_direction(self, start: Coord, direction: Coord, target: str) -> bool:
         """
         Search for a string in the grid following a specific direction.
@@ -232,24 +709,623 @@ class Grid:
         return True
 
     @staticmethod
-    def create(size: Dimension, initial_value: Any) -> Grid:
+    def create(size: Dimension, initial_value: Any, compact: bool = False) -> Grid:
         """
         Create a grid filled with initial value.
 
         Args:
             size: Size of the grid as Dimension(width, height)
             initial_value: Value to fill the grid with
+            compact: Return an ArrayGrid backed by flat storage (default: False)
 
         Returns:
             Grid instance initialized with the specified value
         """
+        if compact:
+            return ArrayGrid.create(size, initial_value)
         data = [[initial_value] * size.width for _ in range(size.height)]
         return Grid(data)
 
 
+def _encode_cells(text: str) -> bytearray:
+    """Encode characters one byte per cell, rejecting non-latin-1 characters."""
+    try:
+        return bytearray(text.encode("latin-1"))
+    except UnicodeEncodeError as error:
+        raise ValueError(
+            f"ArrayGrid cells must be latin-1 characters, got {text[error.start]!r}"
+        ) from None
+
+
+@dataclass
+class ArrayGrid(Grid):
+    """
+    Compact 2D grid stored as one flat buffer with a row stride.
+
+    Character grids use a bytearray (one byte per cell, values read back as
+    single-character strings); integer grids use an int64 array. The
+    coordinate API matches Grid, so solutions can switch storage freely.
+
+    Example:
+        >>> grid = ArrayGrid.from_rows(["#.#", "..."])
+        >>> grid[Coord(1, 0)]
+        '.'
+        >>> grid.size
+        Dimension(width=3, height=2)
+    """
+
+    data: bytearray | array
+    width: int
+
+    def __post_init__(self) -> None:
+        self._text = isinstance(self.data, bytearray)
+
+    @property
+    def height(self) -> int:
+        """Number of rows in the grid."""
+        return len(self.data) // self.width if self.width else 0
+
+    def index(self, coord: Coord) -> int:
+        """Convert coordinate to flat buffer index."""
+        return coord.y * self.width + coord.x
+
+    def coord_at(self, index: int) -> Coord:
+        """Convert flat buffer index back to coordinate."""
+        row, col = divmod(index, self.width)
+        return Coord(col, row)
+
+    def __getitem__(self, coord: Coord) -> Any:
+        """Access grid value using coordinate: grid[coord]."""
+        if not 0 <= coord.x < self.width:
+            raise IndexError(f"Column {coord.x} is outside the grid")
+        value = self.data[coord.y * self.width + coord.x]
+        return chr(value) if self._text else value
+
+    def __setitem__(self, coord: Coord, value: Any) -> None:
+        """Set grid value using coordinate: grid[coord] = value."""
+        if not 0 <= coord.x < self.width:
+            raise IndexError(f"Column {coord.x} is outside the grid")
+        if self._index is not None:
+            self._reindex(coord, self[coord], value)
+        self.data[coord.y * self.width + coord.x] = ord(value) if self._text else value
+
+    def __contains__(self, coord: Coord) -> bool:
+        """Check if coordinate is within bounds: coord in grid."""
+        width = self.width
+        return 0 <= coord.x < width and 0 <= coord.y * width + coord.x < len(self.data)
+
+    @property
+    def size(self) -> Dimension:
+        """Return size of grid as Dimensions(width, height)."""
+        return Dimension(width=self.width, height=self.height)
+
+    def coords(self) -> Iterator[tuple[Coord, Any]]:
+        """
+        Iterate over (coordinate, value) pairs in grid.
+
+        Yields:
+            Tuples of (Coord, value) for each cell in the grid
+        """
+        width = self.width
+        for r in range(self.height):
+            start = r * width
+            row = self.data[start : start + width]
+            if self._text:
+                row = row.decode("latin-1")
+            for c, value in enumerate(row):
+                yield Coord(c, r), value
+
+    def find_first(self, value: Any) -> Coord | None:
+        """Find first occurrence of value in grid, return coordinate or None."""
+        if self._is_indexed(value):
+            return super().find_first(value)
+        try:
+            if self._text:
+                return self.coord_at(self.data.index(ord(value)))
+            return self.coord_at(self.data.index(value))
+        except (ValueError, TypeError):
+            return None
+
+    def find_all(self, value: Any) -> list[Coord]:
+        """Find all occurrences of value in grid, return list of coordinates."""
+        if self._is_indexed(value):
+            return self._indexed(value)
+        if not self._text:
+            return [self.coord_at(i) for i, v in enumerate(self.data) if v == value]
+
+        if not isinstance(value, str) or len(value) != 1 or ord(value) > 0xFF:
+            return []
+        target = ord(value)
+        result = []
+        i = self.data.find(target)
+        while i != -1:
+            result.append(self.coord_at(i))
+            i = self.data.find(target, i + 1)
+        return result
+
+    def _predicate_mask(self, predicate: Callable[[Any], bool]) -> bytearray:
+        """Flat mask with 1 where predicate(value) is true."""
+        if not self._text:
+            return bytearray(bool(predicate(v)) for v in self.data)
+        table = bytes(bool(predicate(chr(b))) for b in range(256))
+        return self.data.translate(table)
+
+    def mask(self, values: set[Any]) -> bytearray:
+        """Flat mask with 1 where the cell value is in values (see Grid.mask)."""
+        if not self._text:
+            return bytearray(v in values for v in self.data)
+
+        table = bytearray(256)
+        for value in values:
+            if isinstance(value, str) and len(value) == 1 and ord(value) <= 0xFF:
+                table[ord(value)] = 1
+        return self.data.translate(table)
+
+    def _fill_rows(self, x1: int, x2: int, y1: int, y2: int, value: Any) -> None:
+        """Slice-assign value into columns x1..x2 of rows y1..y2."""
+        width = self.width
+        span = self.data[:0]
+        span.append(ord(value) if self._text else value)
+        span *= x2 - x1 + 1
+        for y in range(y1, y2 + 1):
+            start = y * width + x1
+            self.data[start : start + len(span)] = span
+
+    def padded(self, sentinel: Any) -> ArrayGrid:
+        """Copy surrounded by a one-cell border of sentinel (see Grid.padded)."""
+        width = self.width
+        fill = ord(sentinel) if self._text else sentinel
+        edge = self.data[:0]
+        edge.append(fill)
+        data = edge * (width + 3)
+        for start in range(0, len(self.data), width):
+            data += self.data[start : start + width]
+            data += edge * 2
+        data += edge * (width + 1)
+        return ArrayGrid(data, width + 2)
+
+    @staticmethod
+    def create(size: Dimension, initial_value: Any) -> ArrayGrid:
+        """
+        Create a compact grid filled with initial value.
+
+        Args:
+            size: Size of the grid as Dimension(width, height)
+            initial_value: Single character (byte storage) or int (int64 storage)
+
+        Returns:
+            ArrayGrid instance initialized with the specified value
+
+        Raises:
+            ValueError: If a string value is not exactly one latin-1 character
+        """
+        cells = size.width * size.height
+        if isinstance(initial_value, str):
+            if len(initial_value) != 1:
+                raise ValueError(
+                    f"ArrayGrid cells hold one character, got {initial_value!r}"
+                )
+            return ArrayGrid(_encode_cells(initial_value) * cells, size.width)
+        return ArrayGrid(array("q", [initial_value]) * cells, size.width)
+
+    @staticmethod
+    def from_rows(rows: list[str] | list[list[Any]]) -> ArrayGrid:
+        """
+        Build a compact grid from equal-length rows.
+
+        Args:
+            rows: Strings (character grid) or lists of single characters or ints
+
+        Returns:
+            ArrayGrid with byte storage for characters, int64 storage for ints
+
+        Raises:
+            ValueError: If rows have different lengths, or character cells are
+                not single latin-1 characters
+        """
+        if not rows:
+            return ArrayGrid(bytearray(), 0)
+
+        width = len(rows[0])
+        if any(len(row) != width for row in rows):
+            raise ValueError("All rows must have the same length")
+
+        if isinstance(rows[0], str):
+            return ArrayGrid(_encode_cells("".join(rows)), width)
+        if width and isinstance(rows[0][0], str):
+            data = _encode_cells("".join("".join(row) for row in rows))
+            if len(data) != width * len(rows):
+                raise ValueError("ArrayGrid cells hold one character each")
+            return ArrayGrid(data, width)
+        return ArrayGrid(array("q", [v for row in rows for v in row]), width)
+
+
+@dataclass
+class SparseGrid:
+    """
+    Unbounded 2D grid backed by a dict, for huge mostly-empty coordinate spaces.
+
+    Only cells that differ from the default value are stored. The bounding
+    box (min_bounds..max_bounds, inclusive) grows to cover every cell ever
+    written, and `coord in grid` checks against it, so searches such as
+    bfs and flood_fill stay bounded. Coordinates may be negative.
+
+    Example:
+        >>> grid = SparseGrid('.')
+        >>> grid[Coord(2_000_000_000, 5)] = '#'
+        >>> grid[Coord(-3, -1)] = '#'
+        >>> grid[Coord(0, 0)], Coord(0, 0) in grid
+        ('.', True)
+        >>> grid.size
+        Dimension(width=2000000004, height=7)
+    """
+
+    default: Any = None
+    cells: dict[Coord, Any] = field(default_factory=dict)
+    min_bounds: Coord | None = None
+    max_bounds: Coord | None = None
+
+    def __post_init__(self) -> None:
+        for coord in list(self.cells):
+            self._expand(coord)
+
+    def _expand(self, coord: Coord) -> None:
+        """Grow the bounding box to include coord."""
+        if self.min_bounds is None or self.max_bounds is None:
+            self.min_bounds = self.max_bounds = coord
+            return
+        lo, hi = self.min_bounds, self.max_bounds
+        if not (lo.x <= coord.x <= hi.x and lo.y <= coord.y <= hi.y):
+            self.min_bounds = Coord(min(lo.x, coord.x), min(lo.y, coord.y))
+            self.max_bounds = Coord(max(hi.x, coord.x), max(hi.y, coord.y))
+
+    def __getitem__(self, coord: Coord) -> Any:
+        """Access grid value using coordinate: grid[coord]."""
+        return self.cells.get(coord, self.default)
+
+    def __setitem__(self, coord: Coord, value: Any) -> None:
+        """Set grid value using coordinate; writing the default frees the cell."""
+        self._expand(coord)
+        if value == self.default:
+            self.cells.pop(coord, None)
+        else:
+            self.cells[coord] = value
+
+    def __contains__(self, coord: Coord) -> bool:
+        """Check if coordinate is within the bounding box: coord in grid."""
+        lo, hi = self.min_bounds, self.max_bounds
+        return lo is not None and lo.x <= coord.x <= hi.x and lo.y <= coord.y <= hi.y
+
+    def __len__(self) -> int:
+        """Number of stored (non-default) cells."""
+        return len(self.cells)
+
+    @property
+    def size(self) -> Dimension:
+        """Return size of the bounding box as Dimension(width, height)."""
+        if self.min_bounds is None:
+            return Dimension(0, 0)
+        return Dimension(
+            width=self.max_bounds.x - self.min_bounds.x + 1,
+            height=self.max_bounds.y - self.min_bounds.y + 1,
+        )
+
+    def coords(self) -> Iterator[tuple[Coord, Any]]:
+        """
+        Iterate over stored (coordinate, value) pairs in row-major order.
+
+        Cells holding the default value are not visited.
+
+        Yields:
+            Tuples of (Coord, value) for each stored cell
+        """
+        for coord in sorted(self.cells, key=lambda c: (c.y, c.x)):
+            yield coord, self.cells[coord]
+
+    def find_first(self, value: Any) -> Coord | None:
+        """Find first stored occurrence of value, return coordinate or None."""
+        found = self.find_all(value)
+        return found[0] if found else None
+
+    def find_all(self, value: Any) -> list[Coord]:
+        """Find all stored occurrences of value (never matches default cells)."""
+        return [coord for coord, cell_value in self.coords() if cell_value == value]
+
+    def group_by_value(self, exclude: Any | None = None) -> dict[Any, list[Coord]]:
+        """
+        Group stored coordinates by their cell values.
+
+        Args:
+            exclude: Optional value to exclude from grouping
+
+        Returns:
+            Dictionary mapping values to lists of coordinates with that value
+        """
+        result = {}
+        for coord, value in self.coords():
+            if value != exclude:
+                result.setdefault(value, []).append(coord)
+        return result
+
+    def to_grid(self) -> Grid:
+        """
+        Materialize the bounding box as a dense Grid.
+
+        Cell Coord(0, 0) of the result corresponds to min_bounds.
+        """
+        grid = Grid.create(self.size, self.default)
+        origin = self.min_bounds
+        for coord, value in self.cells.items():
+            grid.data[coord.y - origin.y][coord.x - origin.x] = value
+        return grid
+
+    @staticmethod
+    def from_coords(coords: list[Coord], value: Any, default: Any = None) -> SparseGrid:
+        """Create a sparse grid with value written at each coordinate."""
+        return SparseGrid(default, {coord: value for coord in coords})
+
+
+_MASK_TO_DIGITS = bytes.maketrans(b"\x00\x01", b"01")
+_DIGITS_TO_MASK = bytes.maketrans(b"01", b"\x00\x01")
+
+
+@dataclass
+class BitGrid:
+    """
+    Binary 2D grid with each row packed into a Python int.
+
+    Bit c of rows[r] is the cell at Coord(c, r). Whole-grid operations
+    (&, |, ^, ~, shift, popcount) work a full row at a time, which makes
+    cellular-automaton style steps word-parallel and stores a cell in one bit.
+
+    Example:
+        >>> rolls = BitGrid.from_grid(Grid([['@', '@', '.'], ['.', '@', '@']]), {'@'})
+        >>> rolls.count()
+        4
+        >>> (rolls & rolls.shift(Coord.RIGHT)).count()
+        2
+    """
+
+    rows: list[int]
+    width: int
+
+    @property
+    def height(self) -> int:
+        """Number of rows in the grid."""
+        return len(self.rows)
+
+    @property
+    def size(self) -> Dimension:
+        """Return size of grid as Dimensions(width, height)."""
+        return Dimension(width=self.width, height=self.height)
+
+    @property
+    def max_bounds(self) -> Coord:
+        """Return maximum valid indices as Dimensions(max_col, max_row)."""
+        return Coord(self.width - 1, self.height - 1)
+
+    @property
+    def _full(self) -> int:
+        return (1 << self.width) - 1
+
+    def __getitem__(self, coord: Coord) -> bool:
+        """Access cell using coordinate: grid[coord]."""
+        return (self.rows[coord.y] >> coord.x) & 1 == 1
+
+    def __setitem__(self, coord: Coord, value: bool) -> None:
+        """Set cell using coordinate: grid[coord] = True."""
+        if value:
+            self.rows[coord.y] |= 1 << coord.x
+        else:
+            self.rows[coord.y] &= ~(1 << coord.x)
+
+    def __contains__(self, coord: Coord) -> bool:
+        """Check if coordinate is within bounds: coord in grid."""
+        return 0 <= coord.x < self.width and 0 <= coord.y < self.height
+
+    def __and__(self, other: BitGrid) -> BitGrid:
+        return BitGrid([a & b for a, b in zip(self.rows, other.rows)], self.width)
+
+    def __or__(self, other: BitGrid) -> BitGrid:
+        return BitGrid([a | b for a, b in zip(self.rows, other.rows)], self.width)
+
+    def __xor__(self, other: BitGrid) -> BitGrid:
+        return BitGrid([a ^ b for a, b in zip(self.rows, other.rows)], self.width)
+
+    def __invert__(self) -> BitGrid:
+        full = self._full
+        return BitGrid([row ^ full for row in self.rows], self.width)
+
+    def count(self) -> int:
+        """Number of set cells (popcount over all rows)."""
+        return sum(row.bit_count() for row in self.rows)
+
+    def coords(self) -> Iterator[tuple[Coord, bool]]:
+        """
+        Iterate over (coordinate, value) pairs in grid.
+
+        Yields:
+            Tuples of (Coord, bool) for each cell in the grid
+        """
+        for r, row in enumerate(self.rows):
+            for c in range(self.width):
+                yield Coord(c, r), (row >> c) & 1 == 1
+
+    def find_first(self, value: bool = True) -> Coord | None:
+        """Find first cell with value, return coordinate or None."""
+        found = self.find_all(value)
+        return found[0] if found else None
+
+    def find_all(self, value: bool = True) -> list[Coord]:
+        """Find all cells with value, return list of coordinates."""
+        full = self._full
+        result = []
+        for r, row in enumerate(self.rows):
+            bits = row if value else row ^ full
+            while bits:
+                low = bits & -bits
+                result.append(Coord(low.bit_length() - 1, r))
+                bits ^= low
+        return result
+
+    def shift(self, direction: Coord) -> BitGrid:
+        """
+        Move every cell by direction; cells shifted off the edge are dropped.
+
+        Args:
+            direction: Offset to apply (e.g. Coord.RIGHT moves cells one column right)
+
+        Returns:
+            New BitGrid where result[c + direction] == self[c]
+        """
+        full, dx, dy = self._full, direction.x, direction.y
+        empty = [0] * min(abs(dy), self.height)
+        if dy >= 0:
+            source = empty + self.rows[: max(self.height - dy, 0)]
+        else:
+            source = self.rows[-dy:] + empty
+
+        if dx >= 0:
+            shifted = [(row << dx) & full for row in source]
+        else:
+            shifted = [row >> -dx for row in source]
+        return BitGrid(shifted, self.width)
+
+    def _neighbor_planes(self, directions: list[Coord]) -> list[list[int]]:
+        """
+        Bit-sliced neighbor counts: planes[p][r] holds bit p of every count in row r.
+
+        Each shifted neighbor grid is added with a ripple-carry adder over
+        whole rows, so counting costs O(len(directions) * log(count)) row ops.
+        """
+        planes: list[list[int]] = []
+        for d in directions:
+            carries = self.shift(Coord(-d.x, -d.y)).rows
+            for plane in planes:
+                next_carries = [p & c for p, c in zip(plane, carries)]
+                plane[:] = [p ^ c for p, c in zip(plane, carries)]
+                carries = next_carries
+            if any(carries):
+                planes.append(carries)
+        return planes
+
+    def neighbors_at_least(
+        self, k: int, directions: list[Coord] | None = None
+    ) -> BitGrid:
+        """
+        Mark cells with at least k set neighbors.
+
+        Args:
+            k: Minimum neighbor count
+            directions: Direction vectors to use (default: DIRECTIONS_CARDINAL)
+
+        Returns:
+            BitGrid with a bit set wherever the neighbor count is >= k
+
+        Example:
+            >>> removable = rolls & ~rolls.neighbors_at_least(4, Coord.DIRECTIONS_ALL)
+        """
+        directions = directions or Coord.DIRECTIONS_CARDINAL
+        full = self._full
+        if k <= 0:
+            return BitGrid([full] * self.height, self.width)
+
+        planes = self._neighbor_planes(directions)
+        if k.bit_length() > len(planes):
+            return BitGrid([0] * self.height, self.width)
+
+        # Compare counts against k from the most significant bit down
+        rows = []
+        for r in range(self.height):
+            greater, equal = 0, full
+            for p in reversed(range(len(planes))):
+                bit = planes[p][r]
+                if (k >> p) & 1:
+                    equal &= bit
+                else:
+                    greater |= equal & bit
+                    equal &= ~bit
+            rows.append(greater | equal)
+        return BitGrid(rows, self.width)
+
+    def count_neighbors(self, directions: list[Coord] | None = None) -> ArrayGrid:
+        """
+        Count set neighbors for every cell (same result shape as Grid.count_neighbors).
+
+        Args:
+            directions: Direction vectors to use (default: DIRECTIONS_CARDINAL)
+
+        Returns:
+            ArrayGrid of the same size holding neighbor counts
+        """
+        directions = directions or Coord.DIRECTIONS_CARDINAL
+        planes = self._neighbor_planes(directions)
+        width = self.width
+
+        counts = bytearray()
+        for r in range(self.height):
+            total = 0
+            for p, plane in enumerate(planes):
+                # Spread bits into byte lanes, then weight the lane by 2^p
+                digits = bin(plane[r])[2:].zfill(width)[::-1].encode()
+                total += (
+                    int.from_bytes(digits.translate(_DIGITS_TO_MASK), "little") << p
+                )
+            counts += total.to_bytes(width, "little")
+        return ArrayGrid(array("B", counts), width)
+
+    def to_grid(self, true_value: Any = "#", false_value: Any = ".") -> Grid:
+        """Convert to a list-backed Grid of true_value / false_value cells."""
+        return Grid(
+            [
+                [
+                    true_value if (row >> c) & 1 else false_value
+                    for c in range(self.width)
+                ]
+                for row in self.rows
+            ]
+        )
+
+    @staticmethod
+    def create(size: Dimension, initial_value: bool = False) -> BitGrid:
+        """Create a bit grid with every cell set to initial_value."""
+        row = (1 << size.width) - 1 if initial_value else 0
+        return BitGrid([row] * size.height, size.width)
+
+    @staticmethod
+    def from_grid(grid: Grid, values: set[Any]) -> BitGrid:
+        """
+        Pack a Grid into bits.
+
+        Args:
+            grid: Grid or ArrayGrid to convert
+            values: Cell values that become set bits
+
+        Returns:
+            BitGrid with a bit set wherever grid value is in values
+        """
+        size = grid.size
+        width = size.width
+        if not width:
+            return BitGrid([0] * size.height, 0)
+        mask = grid.mask(values).translate(_MASK_TO_DIGITS)
+        return BitGrid(
+            [
+                int(mask[start : start + width][::-1], 2)
+                for start in range(0, len(mask), width)
+            ],
+            width,
+        )
+
+
 __all__ = [
     "Coord",
     "Dimension",
     "filter_coords_in_bounds",
+    "neighbor_offsets",
+    "SummedAreaTable",
     "Grid",
+    "ArrayGrid",
+    "BitGrid",
+    "SparseGrid",
 ]
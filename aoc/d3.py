@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from array import array
+from dataclasses import dataclass, field
+from heapq import heappop, heappush, heapreplace, nsmallest
 from typing import Any, ClassVar, Iterator
 
 
@@ -207,9 +209,263 @@ class Grid:
         return Grid(data)
 
 
+@dataclass(frozen=True)
+class PointCloud:
+    """
+    Point set stored as three int64 columns for pairwise-distance work.
+
+    Avoids per-pair Coord objects: distances are computed row by row
+    straight from the columns, and only candidates that can still make
+    the requested result are kept.
+    """
+
+    xs: array
+    ys: array
+    zs: array
+
+    def __len__(self) -> int:
+        return len(self.xs)
+
+    def __getitem__(self, i: int) -> Coord:
+        """Point i as a Coord."""
+        return Coord(self.xs[i], self.ys[i], self.zs[i])
+
+    def squared_distances(self, i: int, start: int = 0) -> list[int]:
+        """
+        Squared distances from point i to points start, start + 1, ...
+
+        Args:
+            i: Index of the reference point
+            start: First index to measure against (default: 0)
+
+        Returns:
+            List of squared distances, entry k is for point start + k
+        """
+        xi, yi, zi = self.xs[i], self.ys[i], self.zs[i]
+        return [
+            (x - xi) * (x - xi) + (y - yi) * (y - yi) + (z - zi) * (z - zi)
+            for x, y, z in zip(self.xs[start:], self.ys[start:], self.zs[start:])
+        ]
+
+    def nearest_pairs(self, k: int, block_size: int = 64) -> list[tuple[int, int, int]]:
+        """
+        The k closest pairs of points, without building all n² pairs.
+
+        Rows are scanned in blocks; each row only keeps pairs strictly below
+        the current k-th best distance, and a block's survivors are merged
+        into the running top k. Result matches sorting every
+        (distance, i, j) with i < j and taking the first k.
+
+        Args:
+            k: Number of pairs to return
+            block_size: Rows scanned between merges (default: 64)
+
+        Returns:
+            Sorted list of (squared_distance, i, j) tuples with i < j
+
+        Example:
+            >>> cloud = PointCloud.from_coords([Coord(0, 0, 0), Coord(5, 0, 0), Coord(1, 0, 0)])
+            >>> cloud.nearest_pairs(2)
+            [(1, 0, 2), (16, 1, 2)]
+        """
+        n = len(self)
+        best: list[tuple[int, int, int]] = []
+        bound = float("inf")
+        if k <= 0:
+            return best
+
+        for block_start in range(0, n, block_size):
+            candidates = []
+            for i in range(block_start, min(block_start + block_size, n)):
+                row = self.squared_distances(i, i + 1)
+                candidates.extend(
+                    (d, i, j) for j, d in enumerate(row, i + 1) if d < bound
+                )
+            best = nsmallest(k, best + candidates)
+            if len(best) == k:
+                bound = best[-1][0]
+        return best
+
+    def to_coords(self) -> list[Coord]:
+        """All points as Coords, in index order."""
+        return [Coord(x, y, z) for x, y, z in zip(self.xs, self.ys, self.zs)]
+
+    @staticmethod
+    def from_coords(coords: list[Coord]) -> PointCloud:
+        """
+        Build a point cloud from 3D coordinates.
+
+        Args:
+            coords: Points, indexed in list order
+
+        Returns:
+            PointCloud with one row per coordinate
+        """
+        return PointCloud(
+            array("q", (c.x for c in coords)),
+            array("q", (c.y for c in coords)),
+            array("q", (c.z for c in coords)),
+        )
+
+
+@dataclass
+class KDTree:
+    """
+    Static KD-tree over 3D points for nearest-neighbor and radius queries.
+
+    The tree is implicit: points are reordered so the median of every index
+    range is that subtree's root, split on x, y, z by depth. Results are
+    exact and ordered by (squared_distance, index), so ties are deterministic.
+
+    Example:
+        >>> tree = KDTree([Coord(0, 0, 0), Coord(5, 0, 0), Coord(1, 0, 0)])
+        >>> tree.nearest(Coord(4, 0, 0), 2)
+        [(1, 1), (9, 2)]
+    """
+
+    points: list[Coord]
+    _order: list[int] = field(init=False, repr=False)
+    _tuples: list[tuple[int, int, int]] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._tuples = [(p.x, p.y, p.z) for p in self.points]
+        self._order = list(range(len(self.points)))
+        stack = [(0, len(self._order), 0)]
+        while stack:
+            lo, hi, depth = stack.pop()
+            if hi - lo <= 1:
+                continue
+            axis = depth % 3
+            self._order[lo:hi] = sorted(
+                self._order[lo:hi], key=lambda i: (self._tuples[i][axis], i)
+            )
+            mid = (lo + hi) // 2
+            stack.append((lo, mid, depth + 1))
+            stack.append((mid + 1, hi, depth + 1))
+
+    def __len__(self) -> int:
+        return len(self.points)
+
+    def nearest(self, point: Coord, k: int = 1) -> list[tuple[int, int]]:
+        """
+        The k points closest to a query point.
+
+        Args:
+            point: Query point (need not be in the tree)
+            k: Number of neighbors to return (default: 1)
+
+        Returns:
+            Up to k (squared_distance, index) tuples, closest first
+        """
+        if k <= 0:
+            return []
+        target = (point.x, point.y, point.z)
+        order, tuples = self._order, self._tuples
+        worst: list[tuple[int, int]] = []  # max-heap of (-distance, -index)
+
+        def visit(lo: int, hi: int, depth: int) -> None:
+            if lo >= hi:
+                return
+            mid = (lo + hi) // 2
+            i = order[mid]
+            c = tuples[i]
+            d = sum((a - b) * (a - b) for a, b in zip(c, target))
+            if len(worst) < k:
+                heappush(worst, (-d, -i))
+            elif (-d, -i) > worst[0]:
+                heapreplace(worst, (-d, -i))
+
+            diff = target[depth % 3] - c[depth % 3]
+            if diff < 0:
+                near, far = (lo, mid), (mid + 1, hi)
+            else:
+                near, far = (mid + 1, hi), (lo, mid)
+            visit(*near, depth + 1)
+            if len(worst) < k or diff * diff <= -worst[0][0]:
+                visit(*far, depth + 1)
+
+        visit(0, len(order), 0)
+        return sorted((-d, -i) for d, i in worst)
+
+    def within(self, point: Coord, radius: float) -> list[tuple[int, int]]:
+        """
+        All points within a Euclidean radius (inclusive) of a query point.
+
+        Args:
+            point: Query point (need not be in the tree)
+            radius: Maximum distance
+
+        Returns:
+            List of (squared_distance, index) tuples, closest first
+        """
+        target = (point.x, point.y, point.z)
+        limit = radius * radius
+        order, tuples = self._order, self._tuples
+        found = []
+        stack = [(0, len(order), 0)]
+        while stack:
+            lo, hi, depth = stack.pop()
+            if lo >= hi:
+                continue
+            mid = (lo + hi) // 2
+            i = order[mid]
+            c = tuples[i]
+            d = sum((a - b) * (a - b) for a, b in zip(c, target))
+            if d <= limit:
+                found.append((d, i))
+            diff = target[depth % 3] - c[depth % 3]
+            if diff <= 0 or diff * diff <= limit:
+                stack.append((lo, mid, depth + 1))
+            if diff >= 0 or diff * diff <= limit:
+                stack.append((mid + 1, hi, depth + 1))
+        return sorted(found)
+
+    def closest_pairs(self) -> Iterator[tuple[int, int, int]]:
+        """
+        Lazily yield every pair of points in order of increasing distance.
+
+        Each point walks its own neighbor list by rank (fetched from the tree
+        in doubling batches); a heap merges those lists, so the next pair
+        costs O(log n) and the n² pair list is never built. Order matches
+        sorting all (squared_distance, i, j) with i < j.
+
+        Yields:
+            Tuples of (squared_distance, i, j) with i < j
+
+        Example:
+            >>> tree = KDTree([Coord(0, 0, 0), Coord(5, 0, 0), Coord(1, 0, 0)])
+            >>> list(tree.closest_pairs())
+            [(1, 0, 2), (16, 1, 2), (25, 0, 1)]
+        """
+        n = len(self)
+        neighbors: list[list[tuple[int, int]]] = [[] for _ in range(n)]
+        requested = [0] * n
+
+        def neighbor(i: int, rank: int) -> tuple[int, int] | None:
+            if rank >= len(neighbors[i]) and requested[i] == len(neighbors[i]):
+                requested[i] = max(4, 2 * requested[i])
+                found = self.nearest(self.points[i], requested[i] + 1)
+                neighbors[i] = [(d, j) for d, j in found if j != i][: requested[i]]
+            return neighbors[i][rank] if rank < len(neighbors[i]) else None
+
+        heap = []
+        for i in range(n):
+            if (first := neighbor(i, 0)) is not None:
+                heappush(heap, (first[0], i, first[1], 0))
+
+        while heap:
+            d, i, j, rank = heappop(heap)
+            if i < j:
+                yield d, i, j
+            if (following := neighbor(i, rank + 1)) is not None:
+                heappush(heap, (following[0], i, following[1], rank + 1))
+
+
 __all__ = [
     "Coord",
     "Dimension",
     "filter_coords_in_bounds",
     "Grid",
+    "KDTree",
+    "PointCloud",
 ]
@@ -0,0 +1,409 @@
+"""
+Rectilinear polygon and point-set geometry on 2D grids.
+
+Depends only on d2; compress builds on this module, never the reverse.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right, insort
+from math import inf
+from typing import Any
+
+from .d2 import Coord, Grid
+
+
+def fill_polygon(grid: Grid, vertices: list[Coord], value: Any) -> None:
+    """
+    Fill a closed rectilinear polygon with an even-odd scanline sweep.
+
+    Every cell inside or on the boundary of the polygon is set to value.
+    Vertical edges (half-open in y) only change the crossing set at their
+    end rows, so the sweep visits those event rows once each and fills
+    every band of identical rows between the crossing pairs with row-slice
+    writes; the edges themselves are then drawn so boundary rows are
+    covered too. No seed point or BFS bookkeeping is needed.
+
+    Args:
+        grid: Grid or ArrayGrid containing every vertex
+        vertices: Polygon vertices in order (consecutive pairs axis-aligned,
+            last vertex connects back to the first)
+        value: Value to write
+
+    Raises:
+        ValueError: If a segment is not horizontal or vertical
+
+    Example:
+        >>> grid = Grid.create(Dimension(5, 4), '.')
+        >>> fill_polygon(grid, [Coord(0, 0), Coord(4, 0), Coord(4, 3), Coord(0, 3)], '#')
+        >>> len(grid.find_all('#'))
+        20
+    """
+    if not vertices:
+        return
+
+    closed = [*vertices, vertices[0]]
+    edges = list(zip(closed, closed[1:]))
+    for a, b in edges:
+        if a.x != b.x and a.y != b.y:
+            raise ValueError(f"Segment {a} -> {b} is not axis-aligned")
+
+    # Vertical edges as (y_min, y_max, x), swept in order of y_min
+    verticals = sorted(
+        (min(a.y, b.y), max(a.y, b.y), a.x)
+        for a, b in edges
+        if a.x == b.x and a.y != b.y
+    )
+    events = sorted({y for y_min, y_max, _ in verticals for y in (y_min, y_max)})
+
+    active: list[tuple[int, int, int]] = []
+    next_edge = 0
+    for y, band_end in zip(events, events[1:]):
+        while next_edge < len(verticals) and verticals[next_edge][0] <= y:
+            active.append(verticals[next_edge])
+            next_edge += 1
+        active = [edge for edge in active if edge[1] > y]
+
+        crossings = sorted(x for _, _, x in active)
+        for x1, x2 in zip(crossings[::2], crossings[1::2]):
+            grid.fill_rect(Coord(x1, y), Coord(x2, band_end - 1), value)
+
+    for a, b in edges:
+        grid.fill_rect(a, b, value)
+
+
+def tile_area(a: Coord, b: Coord) -> int:
+    """Number of unit cells in the inclusive rectangle with corners a and b."""
+    return (abs(a.x - b.x) + 1) * (abs(a.y - b.y) + 1)
+
+
+def _merge_intervals(intervals: list[tuple[int, int]]) -> tuple[list[int], list[int]]:
+    """Merge inclusive integer intervals (touching ones too) into sorted starts/ends."""
+    starts: list[int] = []
+    ends: list[int] = []
+    for lo, hi in sorted(intervals):
+        if ends and lo <= ends[-1] + 1:
+            ends[-1] = max(ends[-1], hi)
+        else:
+            starts.append(lo)
+            ends.append(hi)
+    return starts, ends
+
+
+def _inside_rows(
+    vertices: list[Coord],
+) -> tuple[list[int], list[tuple[list[int], list[int]]]]:
+    """
+    Cells inside or on a closed rectilinear polygon, as interval lists per row.
+
+    Rows are compressed along y only: row 2i is y = ys[i] (a vertex row) and
+    row 2i + 1 stands for every row strictly between ys[i] and ys[i + 1],
+    which are identical (and absent when ys[i + 1] == ys[i] + 1). Each row
+    holds sorted (starts, ends) of disjoint inclusive x-intervals, so memory
+    grows with the number of intervals, not with the polygon's area.
+
+    Returns:
+        Tuple of (ys, rows)
+
+    Raises:
+        ValueError: If a segment is not horizontal or vertical
+    """
+    closed = [*vertices, vertices[0]]
+    edges = list(zip(closed, closed[1:]))
+    for a, b in edges:
+        if a.x != b.x and a.y != b.y:
+            raise ValueError(f"Segment {a} -> {b} is not axis-aligned")
+
+    ys = sorted({v.y for v in vertices})
+    starting: dict[int, list[int]] = {}
+    ending: dict[int, list[int]] = {}
+    horizontals: dict[int, list[tuple[int, int]]] = {}
+    for a, b in edges:
+        if a.x == b.x and a.y != b.y:
+            starting.setdefault(min(a.y, b.y), []).append(a.x)
+            ending.setdefault(max(a.y, b.y), []).append(a.x)
+        elif a.y == b.y:
+            horizontals.setdefault(a.y, []).append((min(a.x, b.x), max(a.x, b.x)))
+
+    # Band i lies strictly between ys[i] and ys[i + 1]: even-odd crossing pairs
+    bands = []
+    active: list[int] = []
+    for y in ys[:-1]:
+        for x in ending.get(y, ()):
+            active.remove(x)
+        for x in starting.get(y, ()):
+            insort(active, x)
+        bands.append(_merge_intervals(list(zip(active[::2], active[1::2]))))
+
+    rows = []
+    for i, y in enumerate(ys):
+        # A vertex-row cell off the horizontal edges matches the bands beside it
+        intervals = list(horizontals.get(y, ()))
+        for band in bands[max(i - 1, 0) : i + 1]:
+            intervals.extend(zip(*band))
+        rows.append(_merge_intervals(intervals))
+        if i < len(bands):
+            rows.append(bands[i])
+    return ys, rows
+
+
+def _interval_at(row: tuple[list[int], list[int]], x: int) -> tuple[int, int] | None:
+    """Inclusive interval of row containing x, or None if x is outside."""
+    starts, ends = row
+    k = bisect_right(starts, x) - 1
+    if k >= 0 and ends[k] >= x:
+        return starts[k], ends[k]
+    return None
+
+
+class _GapTree:
+    """
+    Segment tree over compressed rows answering "how far is x from the outside".
+
+    Each node stores the merged outside gaps of all its rows. For a row range
+    in which x is inside everywhere, the nearest gap end left of x and gap
+    start right of x bound the widest inside span through x, found with
+    O(log n) bisects instead of a row-by-row walk.
+    """
+
+    def __init__(self, ys: list[int], rows: list[tuple[list[int], list[int]]]):
+        size = 1
+        while size < len(rows):
+            size *= 2
+        self.size = size
+        empty: tuple[list[int], list[int]] = ([], [])
+        nodes = [empty] * (2 * size)
+        for k, (starts, ends) in enumerate(rows):
+            if k % 2 and ys[k // 2 + 1] - ys[k // 2] == 1:
+                continue  # Band with no rows in it
+            nodes[size + k] = (
+                [-inf, *(e + 1 for e in ends)],
+                [*(s - 1 for s in starts), inf],
+            )
+        for i in range(size - 1, 0, -1):
+            left, right = nodes[2 * i], nodes[2 * i + 1]
+            nodes[i] = _merge_intervals([*zip(*left), *zip(*right)])
+        self.nodes = nodes
+
+    def span(self, first: int, last: int, x: int) -> tuple[int, int] | None:
+        """Widest (lo, hi) around x inside every row first..last, or None."""
+        lo, hi = -inf, inf
+        i, j = first + self.size, last + self.size + 1
+        while i < j:
+            if i & 1:
+                lo, hi = self._narrow(self.nodes[i], x, lo, hi)
+                i += 1
+            if j & 1:
+                j -= 1
+                lo, hi = self._narrow(self.nodes[j], x, lo, hi)
+            i //= 2
+            j //= 2
+        return (lo, hi) if lo <= x <= hi else None
+
+    @staticmethod
+    def _narrow(gaps: tuple[list[int], list[int]], x: int, lo: float, hi: float):
+        starts, ends = gaps
+        k = bisect_right(starts, x) - 1
+        if k >= 0:
+            if ends[k] >= x:
+                return x + 1, x  # x itself is outside
+            lo = max(lo, ends[k] + 1)
+        if k + 1 < len(starts):
+            hi = min(hi, starts[k + 1] - 1)
+        return lo, hi
+
+
+def largest_inscribed_rectangle(
+    vertices: list[Coord],
+) -> tuple[int, Coord, Coord] | None:
+    """
+    Largest axis-aligned rectangle with two polygon vertices as opposite corners
+    that lies entirely inside (or on) a closed rectilinear polygon.
+
+    The inside is stored as x-interval lists per y-compressed row (and per
+    column), and a segment tree over the rows' outside gaps answers "widest
+    inside span through x across rows a..b" in O(log² n). For polygons whose
+    rows cross the boundary a bounded number of times that needs O(n log n)
+    memory rather than a dense (2n)² grid.
+
+    For each vertex and quadrant, its own row and column reach give an area
+    upper bound; regions are visited in decreasing bound order and the search
+    stops once no bound beats the best area. Within a region, vertex rows are
+    tried from the far end back towards the vertex, stopping as soon as the
+    remaining height times the full row reach cannot win.
+
+    Scope: adversarial shapes (e.g. combs with many long teeth) can still
+    need O(n²) queries, and their gap lists O(n²) memory. Round, puzzle-like
+    polygons with 50,000 vertices take a couple of seconds.
+
+    Args:
+        vertices: Polygon vertices in order (consecutive pairs axis-aligned)
+
+    Returns:
+        Tuple of (area, corner_a, corner_b) with area counted in unit cells
+        (tile_area), or None if there are fewer than two vertices
+
+    Raises:
+        ValueError: If a segment is not horizontal or vertical
+
+    Example:
+        >>> tiles = [Coord(7, 1), Coord(11, 1), Coord(11, 7), Coord(9, 7),
+        ...          Coord(9, 5), Coord(2, 5), Coord(2, 3), Coord(7, 3)]
+        >>> largest_inscribed_rectangle(tiles)[0]
+        24
+    """
+    if len(vertices) < 2:
+        return None
+
+    ys, rows = _inside_rows(vertices)
+    xs, columns = _inside_rows([Coord(v.y, v.x) for v in vertices])
+    gaps = _GapTree(ys, rows)
+    row_of = {y: 2 * i for i, y in enumerate(ys)}
+    column_of = {x: 2 * i for i, x in enumerate(xs)}
+    xs_on_row: dict[int, list[int]] = {}
+    for v in set(vertices):
+        xs_on_row.setdefault(v.y, []).append(v.x)
+    for row_xs in xs_on_row.values():
+        row_xs.sort()
+
+    # One search region per (vertex, quadrant), keyed by its area upper bound
+    regions = []
+    for p in set(vertices):
+        x_lo, x_hi = _interval_at(rows[row_of[p.y]], p.x)
+        y_lo, y_hi = _interval_at(columns[column_of[p.x]], p.y)
+        for x_end in (x_lo, x_hi):
+            for y_end in (y_lo, y_hi):
+                bound = (abs(x_end - p.x) + 1) * (abs(y_end - p.y) + 1)
+                regions.append((bound, p.x, p.y, x_end, y_end))
+    regions.sort(reverse=True)
+
+    best = (0, vertices[0], vertices[1])
+    for bound, px, py, x_end, y_end in regions:
+        if bound <= best[0]:
+            break
+        width = abs(x_end - px) + 1
+        start = row_of[py]
+        step = 2 if y_end < py else -2  # From the far end back towards p
+        for k in range(row_of[y_end], start + step, step):
+            y = ys[k // 2]
+            if width * (abs(y - py) + 1) <= best[0]:
+                break
+            span = gaps.span(min(start, k), max(start, k), px)
+            if span is None:
+                continue
+            row_xs = xs_on_row[y]
+            if x_end >= px:
+                j = bisect_right(row_xs, span[1]) - 1
+                x = row_xs[j] if j >= 0 and row_xs[j] >= px else None
+            else:
+                j = bisect_left(row_xs, span[0])
+                x = row_xs[j] if j < len(row_xs) and row_xs[j] <= px else None
+            if x is not None and (x, y) != (px, py):
+                area = (abs(x - px) + 1) * (abs(y - py) + 1)
+                if area > best[0]:
+                    best = (area, Coord(px, py), Coord(x, y))
+
+    return best
+
+
+def pareto_frontier(points: list[Coord], direction: Coord) -> list[Coord]:
+    """
+    Points not dominated towards a diagonal direction, as a staircase.
+
+    A point p is dominated if another point q is at least as far as p
+    along both axes of direction (e.g. Coord(-1, -1): q.x <= p.x and
+    q.y <= p.y). Runs in O(n log n).
+
+    Args:
+        points: Point set (duplicates allowed)
+        direction: Diagonal direction, e.g. Coord.UP_LEFT or Coord.DOWN_RIGHT
+
+    Returns:
+        Frontier points sorted by increasing x
+
+    Example:
+        >>> pareto_frontier([Coord(0, 2), Coord(1, 1), Coord(2, 2), Coord(2, 0)], Coord(-1, -1))
+        [Coord(x=0, y=2), Coord(x=1, y=1), Coord(x=2, y=0)]
+    """
+    sx, sy = direction.x, direction.y
+    ordered = sorted(set(points), key=lambda p: (-sx * p.x, -sy * p.y))
+    frontier = []
+    for p in ordered:
+        if not frontier or sy * p.y > sy * frontier[-1].y:
+            frontier.append(p)
+    return frontier if sx < 0 else frontier[::-1]
+
+
+def _max_staircase_product(
+    lows: list[Coord], highs: list[Coord]
+) -> tuple[int, Coord, Coord]:
+    """
+    Best tile_area(a, b) with a from the lower-left staircase and b from the
+    upper-right staircase (both sorted by x, so y decreases).
+
+    The best partner index for each low point is monotone in its position,
+    so a divide-and-conquer over low points scans only O((n + m) log n) pairs.
+    """
+    best = (0, lows[0], highs[0])
+    stack = [(0, len(lows) - 1, 0, len(highs) - 1)]
+    while stack:
+        lo, hi, opt_lo, opt_hi = stack.pop()
+        if lo > hi:
+            continue
+        mid = (lo + hi) // 2
+        a = lows[mid]
+        mid_best, mid_opt = None, opt_lo
+        for k in range(opt_lo, opt_hi + 1):
+            b = highs[k]
+            dx, dy = b.x - a.x + 1, b.y - a.y + 1
+            value = dx * dy if dx > 0 or dy > 0 else -dx * dy
+            if mid_best is None or value > mid_best:
+                mid_best, mid_opt = value, k
+        if mid_best > best[0] and highs[mid_opt].x >= a.x and highs[mid_opt].y >= a.y:
+            best = (mid_best, a, highs[mid_opt])
+        stack.append((lo, mid - 1, opt_lo, mid_opt))
+        stack.append((mid + 1, hi, mid_opt, opt_hi))
+    return best
+
+
+def largest_corner_rectangle(points: list[Coord]) -> tuple[int, Coord, Coord] | None:
+    """
+    Largest rectangle (in tile_area) using two points of a set as opposite corners.
+
+    The optimal pair always joins opposite Pareto frontiers: lower-left with
+    upper-right, or upper-left with lower-right. Only those staircases are
+    searched, each pairing with a monotone divide-and-conquer, for
+    O(n log n) total instead of checking all n² pairs.
+
+    Args:
+        points: Point set
+
+    Returns:
+        Tuple of (area, corner_a, corner_b), or None if there are fewer than
+        two points
+
+    Example:
+        >>> largest_corner_rectangle([Coord(2, 5), Coord(11, 1), Coord(7, 3), Coord(2, 3)])
+        (50, Coord(x=2, y=5), Coord(x=11, y=1))
+    """
+    if len(points) < 2:
+        return None
+
+    best = (0, points[0], points[1])
+    for flip in (1, -1):
+        flipped = [Coord(p.x, flip * p.y) for p in points]
+        lows = pareto_frontier(flipped, Coord(-1, -1))
+        highs = pareto_frontier(flipped, Coord(1, 1))
+        area, a, b = _max_staircase_product(lows, highs)
+        if area > best[0]:
+            best = (area, Coord(a.x, flip * a.y), Coord(b.x, flip * b.y))
+    return best
+
+
+__all__ = [
+    "fill_polygon",
+    "pareto_frontier",
+    "largest_corner_rectangle",
+    "tile_area",
+    "largest_inscribed_rectangle",
+]
@@ -1,9 +1,11 @@
-"""Graph algorithms (BFS, DFS, Dijkstra, max clique)."""
+"""Graph algorithms (BFS, DFS, Dijkstra, max clique, union-find, CSR graphs)."""
 
-from typing import Any, Callable
-from collections import deque
-from heapq import heappush, heappop
-from .d2 import Coord, Grid
+from array import array
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterable, Iterator
+from collections import Counter, deque
+from heapq import heapify, heappush, heappop
+from .d2 import Coord, Grid, SparseGrid, neighbor_offsets
 
 
 def bfs(
@@ -57,6 +59,246 @@ def bfs(
     return distances if not goal_func else []
 
 
+def bfs_multi(
+    sources: Iterable[Any],
+    neighbors_func: Callable[[Any], list[Any]],
+) -> dict[Any, int]:
+    """
+    Breadth-first search from many starting states at once.
+
+    Every source starts at distance 0, so each reachable state gets its
+    distance to the nearest source in a single O(V + E) pass, instead of
+    one BFS per source.
+
+    Args:
+        sources: Starting states
+        neighbors_func: Function that returns valid neighbors for a state
+
+    Returns:
+        Dictionary mapping states to distance from the nearest source
+
+    Example:
+        >>> bfs_multi([0, 10], lambda n: [m for m in (n - 1, n + 1) if 0 <= m <= 10])[4]
+        4
+    """
+    distances = {source: 0 for source in sources}
+    queue = deque(distances)
+
+    while queue:
+        current = queue.popleft()
+        next_distance = distances[current] + 1
+        for neighbor in neighbors_func(current):
+            if neighbor not in distances:
+                distances[neighbor] = next_distance
+                queue.append(neighbor)
+
+    return distances
+
+
+def bfs_layers(
+    start: Any,
+    neighbors_func: Callable[[Any], list[Any]],
+    bounded_memory: bool = False,
+) -> Iterator[list[Any]]:
+    """
+    Lazily yield BFS frontiers, one complete layer at a time.
+
+    Layer d holds every state at distance d from start, so callers can stop
+    at the first layer where something happens or aggregate per depth
+    without a distances dict for the whole reachable set.
+
+    With bounded_memory, only the previous and current layers are kept as
+    "seen", making peak memory O(frontier). That is exact when neighbors of
+    a layer-d state lie in layers d - 1, d or d + 1 (undirected graphs,
+    grids, monotonic moves). On other directed graphs states may repeat,
+    and a directed cycle of three or more states makes the generator run
+    forever, so stop on a condition or cap the depth (itertools.islice).
+
+    Args:
+        start: Starting state
+        neighbors_func: Function that returns valid neighbors for a state
+        bounded_memory: Keep only the last two layers' visited sets
+            (default: False, remember every visited state)
+
+    Yields:
+        Lists of states, layer 0 ([start]) first, in discovery order
+
+    Example:
+        >>> layers = bfs_layers(0, lambda n: [m for m in (n - 1, n + 1) if 0 <= m <= 3])
+        >>> list(layers)
+        [[0], [1], [2], [3]]
+    """
+    frontier = [start]
+    previous: set[Any] = set()
+    visited = {start}
+
+    while frontier:
+        yield frontier
+        next_frontier = []
+        if bounded_memory:
+            current = set(frontier)
+            seen = set()
+            for state in frontier:
+                for neighbor in neighbors_func(state):
+                    if neighbor in seen or neighbor in current or neighbor in previous:
+                        continue
+                    seen.add(neighbor)
+                    next_frontier.append(neighbor)
+            previous = current
+        else:
+            for state in frontier:
+                for neighbor in neighbors_func(state):
+                    if neighbor not in visited:
+                        visited.add(neighbor)
+                        next_frontier.append(neighbor)
+        frontier = next_frontier
+
+
+def bfs_indexed(
+    start: int,
+    width: int,
+    passable: bytearray,
+    directions: list[Coord] | None = None,
+    goal: int | None = None,
+    visited: list[int] | None = None,
+) -> tuple[array, array]:
+    """
+    Breadth-first search over flat integer cell indices.
+
+    Fast path for grid searches: neighbors are the current index plus a
+    per-direction offset (see aoc.d2.neighbor_offsets) and walkability comes
+    from a flat mask, so no Coord objects or dict entries are created per
+    step and no per-cell table is needed.
+
+    Args:
+        start: Starting cell index
+        width: Grid width (row stride of passable)
+        passable: Flat row-major mask, nonzero where a cell may be entered
+        directions: Direction vectors to use (default: DIRECTIONS_CARDINAL)
+        goal: Optional cell index to stop at once it is dequeued
+        visited: Optional list; every reached index is appended in BFS order,
+            so callers can walk the reached cells without scanning distances
+
+    Returns:
+        Tuple of (distances, parents) arrays indexed by cell, -1 where unreached
+
+    Example:
+        >>> grid = Grid([['.', '#'], ['.', '.']])
+        >>> distances, _ = bfs_indexed(0, 2, grid.mask({'.'}))
+        >>> list(distances)
+        [0, -1, 1, 2]
+    """
+    n = len(passable)
+    steps = neighbor_offsets(width, directions or Coord.DIRECTIONS_CARDINAL)
+    distances = array("q", [-1]) * n
+    parents = array("q", [-1]) * n
+    distances[start] = 0
+    queue = deque([start])
+    if visited is not None:
+        visited.append(start)
+
+    while queue:
+        current = queue.popleft()
+        if current == goal:
+            break
+
+        next_distance = distances[current] + 1
+        col = current % width
+        for offset, dx in steps:
+            if not 0 <= col + dx < width:
+                continue
+            neighbor = current + offset
+            if 0 <= neighbor < n and passable[neighbor] and distances[neighbor] < 0:
+                distances[neighbor] = next_distance
+                parents[neighbor] = current
+                queue.append(neighbor)
+                if visited is not None:
+                    visited.append(neighbor)
+
+    return distances, parents
+
+
+def bidirectional_bfs(
+    start: Any,
+    goal: Any,
+    neighbors_func: Callable[[Any], list[Any]],
+    reverse_neighbors_func: Callable[[Any], list[Any]] | None = None,
+) -> list[Any]:
+    """
+    Shortest path between two states, searching from both ends at once.
+
+    Each round expands one full BFS layer of the smaller frontier; the
+    first layer that touches the other side's visited set yields the
+    shortest path. Touches roughly two balls of half the radius instead
+    of one full-radius ball.
+
+    Args:
+        start: Starting state
+        goal: Goal state
+        neighbors_func: Function returning states reachable from a state
+        reverse_neighbors_func: Function returning states that reach a state
+            (default: neighbors_func, i.e. an undirected graph)
+
+    Returns:
+        List of states forming a shortest path from start to goal (same
+        format as bfs with a goal_func), or empty list if no path
+
+    Example:
+        >>> bidirectional_bfs(0, 5, lambda n: [n - 1, n + 1])
+        [0, 1, 2, 3, 4, 5]
+    """
+    reverse_neighbors_func = reverse_neighbors_func or neighbors_func
+    if start == goal:
+        return [start]
+
+    forward = {start: None}  # state -> parent towards start
+    backward = {goal: None}  # state -> parent towards goal
+    forward_frontier, backward_frontier = [start], [goal]
+
+    while forward_frontier and backward_frontier:
+        expand_forward = len(forward_frontier) <= len(backward_frontier)
+        if expand_forward:
+            frontier, parents, others = forward_frontier, forward, backward
+            expand = neighbors_func
+        else:
+            frontier, parents, others = backward_frontier, backward, forward
+            expand = reverse_neighbors_func
+
+        next_frontier = []
+        meeting = None
+        for current in frontier:
+            for neighbor in expand(current):
+                if neighbor in parents:
+                    continue
+                parents[neighbor] = current
+                if neighbor in others:
+                    meeting = neighbor
+                    break
+                next_frontier.append(neighbor)
+            if meeting is not None:
+                break
+
+        if meeting is not None:
+            path = []
+            node = meeting
+            while node is not None:
+                path.append(node)
+                node = forward[node]
+            path.reverse()
+            node = backward[meeting]
+            while node is not None:
+                path.append(node)
+                node = backward[node]
+            return path
+
+        if expand_forward:
+            forward_frontier = next_frontier
+        else:
+            backward_frontier = next_frontier
+
+    return []
+
+
 def dfs(
     start: Any,
     neighbors_func: Callable[[Any], list[Any]],
@@ -107,8 +349,26 @@ def dfs(
     return None
 
 
+def _create_grid_neighbors_func(
+    grid: Grid | SparseGrid,
+    walkable_values: set[Any],
+    directions: list[Coord],
+) -> Callable[[Coord], list[Coord]]:
+    """Create a neighbor function yielding in-bounds walkable coordinates."""
+    def neighbors_func(coord: Coord) -> list[Coord]:
+        """Get valid neighboring coordinates in the grid."""
+        return [
+            neighbor
+            for direction in directions
+            if (neighbor := coord + direction) in grid
+            and grid[neighbor] in walkable_values
+        ]
+
+    return neighbors_func
+
+
 def _create_grid_search_functions(
-    grid: Grid,
+    grid: Grid | SparseGrid,
     end: Coord,
     walkable_values: set[Any],
 ) -> tuple[Callable[[Coord], list[Coord]], Callable[[Coord], bool]]:
@@ -125,14 +385,9 @@ def _create_grid_search_functions(
     Returns:
         Tuple of (neighbors_func, goal_func) for use with generic search algorithms
     """
-    def neighbors_func(coord: Coord) -> list[Coord]:
-        """Get valid neighboring coordinates in the grid."""
-        return [
-            neighbor
-            for direction in Coord.DIRECTIONS_CARDINAL
-            if (neighbor := coord + direction) in grid
-            and grid[neighbor] in walkable_values
-        ]
+    neighbors_func = _create_grid_neighbors_func(
+        grid, walkable_values, Coord.DIRECTIONS_CARDINAL
+    )
 
     def goal_func(coord: Coord) -> bool:
         """Check if we've reached the goal."""
@@ -142,10 +397,11 @@ def _create_grid_search_functions(
 
 
 def bfs_grid_path(
-    grid: Grid,
+    grid: Grid | SparseGrid,
     start: Coord,
     end: Coord,
     walkable_values: set[Any],
+    indexed: bool = False,
 ) -> list[Coord]:
     """
     Convenience wrapper for breadth-first search through a grid maze.
@@ -158,6 +414,7 @@ def bfs_grid_path(
         start: Starting coordinate
         end: Goal coordinate
         walkable_values: Set of grid values that can be traversed
+        indexed: Search a Grid via bfs_indexed() on flat cell indices
 
     Returns:
         List of coordinates forming shortest path from start to end, or empty list if no path found
@@ -170,14 +427,42 @@ def bfs_grid_path(
 
     Note:
         BFS guarantees the shortest path in unweighted graphs.
+        With indexed=True, Coords are only created for the returned path,
+        but the mask and distance arrays cost O(width * height) per call:
+        use it for long paths through large mazes, not for short hops.
     """
-    neighbors_func, goal_func = _create_grid_search_functions(grid, end, walkable_values)
-    result = bfs(start, neighbors_func, goal_func)
-    return result if isinstance(result, list) else []
+    if not indexed or not isinstance(grid, Grid):
+        neighbors_func, goal_func = _create_grid_search_functions(
+            grid, end, walkable_values
+        )
+        result = bfs(start, neighbors_func, goal_func)
+        return result if isinstance(result, list) else []
+
+    if start == end:
+        return [start]
+    if start not in grid or end not in grid:
+        return []
+
+    goal = grid.index(end)
+    distances, parents = bfs_indexed(
+        grid.index(start),
+        grid.size.width,
+        grid.mask(walkable_values),
+        goal=goal,
+    )
+    if distances[goal] < 0:
+        return []
+
+    path = []
+    node = goal
+    while node >= 0:
+        path.append(grid.coord_at(node))
+        node = parents[node]
+    return list(reversed(path))
 
 
 def dfs_grid_path(
-    grid: Grid,
+    grid: Grid | SparseGrid,
     start: Coord,
     end: Coord,
     walkable_values: set[Any],
@@ -214,10 +499,11 @@ def dfs_grid_path(
 
 
 def flood_fill(
-    grid: Grid,
+    grid: Grid | SparseGrid,
     start: Coord,
     walkable_values: set[Any],
     directions: list[Coord] | None = None,
+    indexed: bool = False,
 ) -> set[Coord]:
     """
     Non-destructive flood fill that returns all reachable coordinates.
@@ -230,6 +516,7 @@ def flood_fill(
         start: Starting coordinate for flood fill
         walkable_values: Set of grid values that can be traversed
         directions: Direction vectors to use (default: DIRECTIONS_CARDINAL for 4-way)
+        indexed: Search a Grid via bfs_indexed() on flat cell indices
 
     Returns:
         Set of all coordinates reachable from start (empty set if start invalid)
@@ -242,27 +529,156 @@ def flood_fill(
 
     Note:
         For in-place marking of visited cells, use flood_fill_mark() instead.
+        indexed=True pays O(width * height) up front for the mask and
+        distance arrays, so it only wins when the filled region is large.
     """
     if start not in grid or grid[start] not in walkable_values:
         return set()
 
     directions = directions or Coord.DIRECTIONS_CARDINAL
+    if not indexed or not isinstance(grid, Grid):
+        neighbors_func = _create_grid_neighbors_func(grid, walkable_values, directions)
+        return set(bfs(start, neighbors_func))
+
+    reached: list[int] = []
+    bfs_indexed(
+        grid.index(start),
+        grid.size.width,
+        grid.mask(walkable_values),
+        directions,
+        visited=reached,
+    )
+    return {grid.coord_at(i) for i in reached}
+
+
+def _bfs_padded(
+    grid: Grid,
+    start: Coord,
+    walkable_values: set[Any],
+    directions: list[Coord],
+    goal: Coord | None = None,
+) -> tuple[array, array]:
+    """
+    Flat-index BFS over a sentinel-padded grid without any bounds checks.
 
-    def neighbors_func(coord: Coord) -> list[Coord]:
-        return [
-            neighbor
-            for direction in directions
-            if (neighbor := coord + direction) in grid
-            and grid[neighbor] in walkable_values
-        ]
+    Neighbors are current + constant offset; the non-walkable border stops
+    the search before an index can leave the grid or wrap to another row.
 
-    distances = bfs(start, neighbors_func)
-    return set(distances.keys())
+    Raises:
+        ValueError: If any border cell is walkable
+    """
+    width = grid.size.width
+    passable = grid.mask(walkable_values)
+    if (
+        any(passable[:width])
+        or any(passable[-width:])
+        or any(passable[::width])
+        or any(passable[width - 1 :: width])
+    ):
+        raise ValueError(
+            "Grid border must not be walkable; build it with Grid.padded()"
+        )
 
+    offsets = [d.y * width + d.x for d in directions]
+    goal_index = grid.index(goal) if goal is not None else None
+    distances = array("q", [-1]) * len(passable)
+    parents = array("q", [-1]) * len(passable)
+    start_index = grid.index(start)
+    distances[start_index] = 0
+    queue = deque([start_index])
 
-def flood_fill_mark(
+    while queue:
+        current = queue.popleft()
+        if current == goal_index:
+            break
+
+        next_distance = distances[current] + 1
+        for offset in offsets:
+            neighbor = current + offset
+            if passable[neighbor] and distances[neighbor] < 0:
+                distances[neighbor] = next_distance
+                parents[neighbor] = current
+                queue.append(neighbor)
+
+    return distances, parents
+
+
+def bfs_padded_path(
     grid: Grid,
     start: Coord,
+    end: Coord,
+    walkable_values: set[Any],
+    directions: list[Coord] | None = None,
+) -> list[Coord]:
+    """
+    Shortest grid path on a grid built with Grid.padded().
+
+    Same result as bfs_grid_path, but the one-cell non-walkable border lets
+    every neighbor probe skip bounds checks. Coordinates are in the padded
+    grid's frame (original coordinate + (1, 1)).
+
+    Args:
+        grid: Padded grid whose border value is not in walkable_values
+        start: Starting coordinate (interior cell)
+        end: Goal coordinate
+        walkable_values: Set of grid values that can be traversed
+        directions: Direction vectors to use (default: DIRECTIONS_CARDINAL)
+
+    Returns:
+        List of coordinates forming shortest path from start to end, or empty list if no path found
+
+    Example:
+        >>> maze = Grid([['.', '#'], ['.', '.']]).padded('#')
+        >>> len(bfs_padded_path(maze, Coord(1, 1), Coord(2, 2), {'.'}))
+        3
+    """
+    if start == end:
+        return [start]
+
+    distances, parents = _bfs_padded(
+        grid, start, walkable_values, directions or Coord.DIRECTIONS_CARDINAL, end
+    )
+    node = grid.index(end)
+    if distances[node] < 0:
+        return []
+
+    path = []
+    while node >= 0:
+        path.append(grid.coord_at(node))
+        node = parents[node]
+    return list(reversed(path))
+
+
+def flood_fill_padded(
+    grid: Grid,
+    start: Coord,
+    walkable_values: set[Any],
+    directions: list[Coord] | None = None,
+) -> set[Coord]:
+    """
+    Flood fill on a grid built with Grid.padded(), skipping bounds checks.
+
+    Args:
+        grid: Padded grid whose border value is not in walkable_values
+        start: Starting coordinate for flood fill
+        walkable_values: Set of grid values that can be traversed
+        directions: Direction vectors to use (default: DIRECTIONS_CARDINAL for 4-way)
+
+    Returns:
+        Set of all coordinates reachable from start (empty set if start not walkable)
+    """
+    if start not in grid or grid[start] not in walkable_values:
+        return set()
+
+    distances, _ = _bfs_padded(
+        grid, start, walkable_values, directions or Coord.DIRECTIONS_CARDINAL
+    )
+    return {grid.coord_at(i) for i, distance in enumerate(distances) if distance >= 0}
+
+
+def flood_fill_mark(
+    grid: Grid | SparseGrid,
+    start: Coord,
     walkable_values: set[Any],
     mark_value: Any,
     directions: list[Coord] | None = None,
@@ -352,6 +768,195 @@ def dijkstra(
     return distances
 
 
+def dijkstra_buckets(
+    start: Any,
+    neighbors_func: Callable[[Any], list[tuple[Any, int]]],
+    max_edge_cost: int,
+    goal: Any | None = None,
+) -> dict[Any, int]:
+    """
+    Dijkstra with a circular bucket queue (Dial's algorithm) for small integer costs.
+
+    States wait in bucket (distance % (max_edge_cost + 1)); since no edge
+    spans more than max_edge_cost, one lap of buckets covers every pending
+    distance. Runs in O(V + E + max distance) with no heap or tuples.
+
+    Args:
+        start: Starting state
+        neighbors_func: Function returning list of (neighbor_state, cost)
+            tuples, integer costs in 0..max_edge_cost
+        max_edge_cost: Largest edge cost that can occur
+        goal: Optional goal state (returns early once it is settled)
+
+    Returns:
+        Dictionary mapping states to shortest distances from start (same as
+        dijkstra)
+
+    Raises:
+        ValueError: If an edge cost is outside 0..max_edge_cost
+
+    Example:
+        >>> graph = {'A': [('B', 1000), ('C', 1)], 'C': [('B', 1)], 'B': []}
+        >>> dijkstra_buckets('A', lambda n: graph[n], max_edge_cost=1000)
+        {'A': 0, 'B': 2, 'C': 1}
+    """
+    num_buckets = max_edge_cost + 1
+    buckets = [[] for _ in range(num_buckets)]
+    buckets[0].append(start)
+    distances = {start: 0}
+    pending = 1
+    dist = 0
+
+    while pending:
+        bucket = buckets[dist % num_buckets]
+        while bucket:
+            current = bucket.pop()
+            pending -= 1
+            if distances[current] != dist:
+                continue  # Stale entry, settled at a smaller distance
+
+            if goal is not None and current == goal:
+                return distances
+
+            for neighbor, cost in neighbors_func(current):
+                if not 0 <= cost <= max_edge_cost:
+                    raise ValueError(f"Edge cost {cost} outside 0..{max_edge_cost}")
+                new_dist = dist + cost
+                if neighbor not in distances or new_dist < distances[neighbor]:
+                    distances[neighbor] = new_dist
+                    buckets[new_dist % num_buckets].append(neighbor)
+                    pending += 1
+        dist += 1
+
+    return distances
+
+
+def bfs_01(
+    start: Any,
+    neighbors_func: Callable[[Any], list[tuple[Any, int]]],
+    goal: Any | None = None,
+) -> dict[Any, int]:
+    """
+    Shortest paths when every edge costs 0 or 1, using a deque.
+
+    Cost-0 neighbors go to the front and cost-1 neighbors to the back, so
+    the deque stays sorted by distance. O(V + E), no heap.
+
+    Args:
+        start: Starting state
+        neighbors_func: Function returning list of (neighbor_state, cost)
+            tuples with cost 0 or 1
+        goal: Optional goal state (returns early once it is dequeued)
+
+    Returns:
+        Dictionary mapping states to shortest distances from start (same as
+        dijkstra)
+
+    Raises:
+        ValueError: If an edge cost is not 0 or 1
+
+    Example:
+        >>> graph = {'A': [('B', 1), ('C', 0)], 'C': [('B', 0)], 'B': []}
+        >>> bfs_01('A', lambda n: graph[n])
+        {'A': 0, 'B': 0, 'C': 0}
+    """
+    queue = deque([start])
+    distances = {start: 0}
+
+    while queue:
+        current = queue.popleft()
+        if goal is not None and current == goal:
+            return distances
+
+        dist = distances[current]
+        for neighbor, cost in neighbors_func(current):
+            if cost == 0:
+                if neighbor not in distances or dist < distances[neighbor]:
+                    distances[neighbor] = dist
+                    queue.appendleft(neighbor)
+            elif cost == 1:
+                if neighbor not in distances or dist + 1 < distances[neighbor]:
+                    distances[neighbor] = dist + 1
+                    queue.append(neighbor)
+            else:
+                raise ValueError(f"Edge cost {cost} is not 0 or 1")
+
+    return distances
+
+
+def astar(
+    start: Any,
+    goal: Any,
+    neighbors_func: Callable[[Any], list[tuple[Any, int]]],
+    heuristic: Callable[[Any, Any], int],
+) -> tuple[int | None, list[Any]]:
+    """
+    A* shortest path: Dijkstra guided by an estimate of the remaining cost.
+
+    States are expanded in order of cost-so-far + heuristic(state, goal),
+    so with a good estimate far fewer states are touched than by dijkstra.
+    The heuristic must never overestimate (and should be consistent, e.g.
+    manhattan_heuristic for 4-way unit-cost grid moves, chebyshev_heuristic
+    for 8-way moves).
+
+    Args:
+        start: Starting state
+        goal: Goal state
+        neighbors_func: Function returning list of (neighbor_state, cost) tuples
+        heuristic: Function (state, goal) -> lower bound on remaining cost
+
+    Returns:
+        Tuple of (distance, path from start to goal), or (None, []) if the
+        goal is unreachable
+
+    Example:
+        >>> def neighbors(c):
+        ...     return [(n, 1) for n in c.neighbors(Coord(9, 9))]
+        >>> distance, path = astar(Coord(0, 0), Coord(3, 2), neighbors, manhattan_heuristic)
+        >>> distance, len(path)
+        (5, 6)
+    """
+    counter = 0
+    pq = [(heuristic(start, goal), 0, counter, start)]
+    distances = {start: 0}
+    parents = {start: None}
+
+    while pq:
+        _, dist, _, current = heappop(pq)
+
+        if dist > distances[current]:
+            continue
+
+        if current == goal:
+            path = []
+            node = current
+            while node is not None:
+                path.append(node)
+                node = parents[node]
+            return dist, list(reversed(path))
+
+        for neighbor, cost in neighbors_func(current):
+            new_dist = dist + cost
+            if neighbor not in distances or new_dist < distances[neighbor]:
+                distances[neighbor] = new_dist
+                parents[neighbor] = current
+                counter += 1
+                priority = new_dist + heuristic(neighbor, goal)
+                heappush(pq, (priority, new_dist, counter, neighbor))
+
+    return None, []
+
+
+def manhattan_heuristic(state: Any, goal: Any) -> int:
+    """A* heuristic for 4-way unit moves on aoc.d2.Coord or aoc.d3.Coord."""
+    return state.manhattan_distance(goal)
+
+
+def chebyshev_heuristic(state: Any, goal: Any) -> int:
+    """A* heuristic for 8-way unit moves on aoc.d2.Coord."""
+    return state.chebyshev_distance(goal)
+
+
 def count_paths_dag(
     start: Any,
     target: Any,
@@ -386,6 +991,193 @@ def count_paths_dag(
     return count(start)
 
 
+def _topological_order(
+    roots: Iterable[Any], neighbors_func: Callable[[Any], list[Any]]
+) -> tuple[list[Any], list[list[int]]]:
+    """
+    Topologically sort the DAG reachable from roots, without recursion.
+
+    Returns (nodes, successors): nodes in topological order, and for each
+    position the positions of its successors (all greater than its own).
+    neighbors_func is called once per node.
+
+    Raises:
+        ValueError: If a cycle is reachable from roots
+    """
+    state: dict[Any, int] = {}  # 1 = on the DFS stack, 2 = finished
+    children: dict[Any, list[Any]] = {}
+    finished = []
+    for root in roots:
+        if root in state:
+            continue
+        state[root] = 1
+        children[root] = list(neighbors_func(root))
+        stack = [(root, iter(children[root]))]
+        while stack:
+            node, pending = stack[-1]
+            for neighbor in pending:
+                seen = state.get(neighbor)
+                if seen is None:
+                    state[neighbor] = 1
+                    children[neighbor] = list(neighbors_func(neighbor))
+                    stack.append((neighbor, iter(children[neighbor])))
+                    break
+                if seen == 1:
+                    raise ValueError(f"Graph has a cycle through {neighbor!r}")
+            else:
+                stack.pop()
+                state[node] = 2
+                finished.append(node)
+
+    nodes = finished[::-1]
+    ids = {node: i for i, node in enumerate(nodes)}
+    successors = [[ids[child] for child in children[node]] for node in nodes]
+    return nodes, successors
+
+
+class PathCounter:
+    """
+    Path counts in a DAG, reusing one topological sort for every query.
+
+    The graph reachable from roots is sorted once (iteratively). Counts from
+    one source to all nodes, or to one target from all nodes, are single
+    linear sweeps over that order and are cached, so any (a, b) query after
+    the first sweep through a or b is a lookup.
+
+    Example:
+        >>> graph = {'A': ['B', 'C'], 'B': ['D'], 'C': ['D'], 'D': []}
+        >>> counter = PathCounter(['A'], lambda n: graph.get(n, []))
+        >>> counter.count('A', 'D'), counter.count('B', 'D')
+        (2, 1)
+    """
+
+    def __init__(
+        self, roots: Iterable[Any], neighbors_func: Callable[[Any], list[Any]]
+    ):
+        """
+        Args:
+            roots: Nodes whose reachable subgraph is counted over
+            neighbors_func: Function that returns list of neighbor nodes
+
+        Raises:
+            ValueError: If the reachable graph contains a cycle
+        """
+        self.nodes, self.successors = _topological_order(roots, neighbors_func)
+        self.ids = {node: i for i, node in enumerate(self.nodes)}
+        self._from: dict[int, list[int]] = {}
+        self._to: dict[int, list[int]] = {}
+
+    def _paths_from(self, source: int) -> list[int]:
+        if source not in self._from:
+            counts = [0] * len(self.nodes)
+            counts[source] = 1
+            successors = self.successors
+            for u in range(source, len(counts)):
+                if counts[u]:
+                    for v in successors[u]:
+                        counts[v] += counts[u]
+            self._from[source] = counts
+        return self._from[source]
+
+    def _paths_to(self, target: int) -> list[int]:
+        if target not in self._to:
+            counts = [0] * len(self.nodes)
+            counts[target] = 1
+            successors = self.successors
+            for u in range(target - 1, -1, -1):
+                counts[u] = sum(counts[v] for v in successors[u])
+            self._to[target] = counts
+        return self._to[target]
+
+    def paths_from(self, source: Any) -> dict[Any, int]:
+        """Paths from source to every node it reaches (KeyError if unknown)."""
+        counts = self._paths_from(self.ids[source])
+        return {self.nodes[i]: c for i, c in enumerate(counts) if c}
+
+    def paths_to(self, target: Any) -> dict[Any, int]:
+        """Paths to target from every node that reaches it (KeyError if unknown)."""
+        counts = self._paths_to(self.ids[target])
+        return {self.nodes[i]: c for i, c in enumerate(counts) if c}
+
+    def count(self, start: Any, target: Any) -> int:
+        """
+        Number of paths from start to target.
+
+        Uses a cached sweep from start or to target when one exists,
+        otherwise sweeps from start and caches it.
+
+        Args:
+            start: Starting node
+            target: Target node
+
+        Returns:
+            Number of distinct paths (1 if start == target, 0 if unknown)
+        """
+        if start == target:
+            return 1
+        if start not in self.ids or target not in self.ids:
+            return 0
+        a, b = self.ids[start], self.ids[target]
+        if b in self._to and a not in self._from:
+            return self._to[b][a]
+        return self._paths_from(a)[b]
+
+
+def count_paths_via(
+    start: Any,
+    target: Any,
+    waypoints: Iterable[Any],
+    neighbors_func: Callable[[Any], list[Any]],
+) -> int:
+    """
+    Count paths from start to target in a DAG that visit every waypoint, in any order.
+
+    One sweep in topological order carries, per node, the number of paths
+    reaching it for each subset (bitmask) of waypoints seen so far. Work is
+    O((V + E) × 2^k) for k waypoints, with no per-ordering recomputation, and
+    only masks that actually occur are stored.
+
+    Args:
+        start: Starting node
+        target: Target node
+        waypoints: Nodes every counted path must pass through
+        neighbors_func: Function that returns list of neighbor nodes
+
+    Returns:
+        Number of distinct start → target paths through all waypoints
+
+    Raises:
+        ValueError: If a cycle is reachable from start
+
+    Example:
+        >>> graph = {'A': ['B', 'C'], 'B': ['C', 'D'], 'C': ['D'], 'D': []}
+        >>> count_paths_via('A', 'D', ['B', 'C'], lambda n: graph.get(n, []))
+        1
+    """
+    nodes, successors = _topological_order([start], neighbors_func)
+    bits = {waypoint: 1 << i for i, waypoint in enumerate(dict.fromkeys(waypoints))}
+    full = (1 << len(bits)) - 1
+    node_bits = [bits.get(node, 0) for node in nodes]
+
+    counts: list[dict[int, int] | None] = [None] * len(nodes)
+    counts[0] = {node_bits[0]: 1}
+    for u, by_mask in enumerate(counts):
+        if by_mask is None:
+            continue
+        if nodes[u] == target:
+            return by_mask.get(full, 0)
+        for v in successors[u]:
+            if counts[v] is None:
+                counts[v] = {}
+            out = counts[v]
+            for mask, count in by_mask.items():
+                key = mask | node_bits[v]
+                out[key] = out.get(key, 0) + count
+        counts[u] = None  # Finished: free it
+
+    return 0
+
+
 def count_paths_cyclic(
     start: Any,
     target: Any,
@@ -478,15 +1270,35 @@ def find_max_clique(graph: dict[Any, set[Any]]) -> set[Any]:
 
 
 class UnionFind:
+    """
+    Disjoint set union over elements 0..n-1.
+
+    Parents, ranks and sizes live in flat arrays; find uses iterative path
+    halving, so long chains never hit the recursion limit. The component
+    count and a histogram of component sizes are updated on every union,
+    making count_components and get_component_sizes independent of n.
+
+    Example:
+        >>> uf = UnionFind(4)
+        >>> uf.union_many([0, 2], [1, 3])
+        2
+        >>> uf.count_components(), uf.size_histogram
+        (2, Counter({2: 2}))
+    """
+
     def __init__(self, n):
-        self.parent = list(range(n))
-        self.rank = [0] * n
-        self.size = [1] * n
+        self.parent = array("i", range(n))
+        self.rank = array("B", bytes(n))
+        self.size = array("i", [1]) * n
+        self.components = n
+        self.size_histogram = Counter({1: n}) if n else Counter()
 
     def find(self, x):
-        if self.parent[x] != x:
-            self.parent[x] = self.find(self.parent[x])
-        return self.parent[x]
+        parent = self.parent
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
 
     def union(self, x, y):
         root_x = self.find(x)
@@ -496,43 +1308,388 @@ class UnionFind:
             return False
 
         if self.rank[root_x] < self.rank[root_y]:
-            self.parent[root_x] = root_y
-            self.size[root_y] += self.size[root_x]
-        elif self.rank[root_x] > self.rank[root_y]:
-            self.parent[root_y] = root_x
-            self.size[root_x] += self.size[root_y]
-        else:
-            self.parent[root_y] = root_x
-            self.size[root_x] += self.size[root_y]
+            root_x, root_y = root_y, root_x
+        elif self.rank[root_x] == self.rank[root_y]:
             self.rank[root_x] += 1
 
+        histogram = self.size_histogram
+        for size in (self.size[root_x], self.size[root_y]):
+            histogram[size] -= 1
+            if not histogram[size]:
+                del histogram[size]
+        self.parent[root_y] = root_x
+        self.size[root_x] += self.size[root_y]
+        histogram[self.size[root_x]] += 1
+
+        self.components -= 1
         return True
 
+    def union_many(self, edges_i, edges_j):
+        """
+        Union pairs (edges_i[k], edges_j[k]) in order.
+
+        Args:
+            edges_i: Sequence (list, array, ...) of first endpoints
+            edges_j: Sequence of second endpoints, same length
+
+        Returns:
+            Number of unions that merged two components
+        """
+        union = self.union
+        return sum(union(i, j) for i, j in zip(edges_i, edges_j))
+
     def get_component_sizes(self):
-        sizes = {}
-        for i in range(len(self.parent)):
-            root = self.find(i)
-            if root not in sizes:
-                sizes[root] = self.size[root]
-        return list(sizes.values())
+        return [
+            size
+            for size, count in sorted(self.size_histogram.items(), reverse=True)
+            for _ in range(count)
+        ]
 
     def count_components(self):
-        roots = set()
-        for i in range(len(self.parent)):
-            roots.add(self.find(i))
-        return len(roots)
+        return self.components
+
+
+def heap_ordered(items: Iterable[Any]) -> Iterator[Any]:
+    """
+    Yield items in ascending order, sorting only as far as they are consumed.
+
+    Heapifies in O(n) and pops lazily, so taking the first k items costs
+    O(n + k log n) instead of a full sort.
+
+    Args:
+        items: Comparable items (e.g. (weight, i, j) edge tuples)
+
+    Yields:
+        Items from smallest to largest
+
+    Example:
+        >>> gen = heap_ordered([(5, 0, 1), (1, 1, 2), (3, 0, 2)])
+        >>> next(gen)
+        (1, 1, 2)
+    """
+    heap = list(items)
+    heapify(heap)
+    while heap:
+        yield heappop(heap)
+
+
+def kruskal(
+    num_nodes: int,
+    edges: Iterable[tuple[Any, int, int]],
+    target_components: int = 1,
+) -> tuple[UnionFind, tuple[Any, int, int] | None]:
+    """
+    Merge nodes along edges in ascending order until few enough components remain.
+
+    Consumes the edge stream lazily and stops as soon as the component count
+    reaches target_components, so edges can come from a generator such as
+    heap_ordered or KDTree.closest_pairs without being fully sorted.
+
+    Args:
+        num_nodes: Number of nodes, labelled 0..num_nodes-1
+        edges: (weight, i, j) tuples in ascending weight order
+        target_components: Stop when this many components remain (default: 1,
+            a spanning tree)
+
+    Returns:
+        Tuple of (union_find, last_edge), where last_edge is the edge whose
+        union reached the target, or None if the edges ran out first (or the
+        target was already met)
+
+    Example:
+        >>> edges = [(1, 0, 1), (2, 1, 2), (3, 0, 2), (4, 2, 3)]
+        >>> uf, last = kruskal(4, heap_ordered(edges))
+        >>> last
+        (4, 2, 3)
+    """
+    uf = UnionFind(num_nodes)
+    if uf.count_components() <= target_components:
+        return uf, None
+    for edge in edges:
+        if uf.union(edge[1], edge[2]) and uf.count_components() <= target_components:
+            return uf, edge
+    return uf, None
+
+
+@dataclass
+class CompactGraph:
+    """
+    Directed graph in compressed sparse row (CSR) form over interned labels.
+
+    Node labels are mapped to ids 0..n-1 once; the out-edges of node u are
+    targets[offsets[u]:offsets[u + 1]] (with matching weights when given).
+    Searches keep their state in flat arrays indexed by id instead of dicts
+    keyed by labels, and never call a Python neighbors function.
+
+    Example:
+        >>> graph = CompactGraph.from_adjacency({'A': ['B', 'C'], 'B': ['D'], 'C': ['D']})
+        >>> distances, parents = graph.bfs('A')
+        >>> distances[graph.id('D')]
+        2
+        >>> graph.path(parents, 'D')
+        ['A', 'B', 'D']
+    """
+
+    labels: list[Any]
+    offsets: array
+    targets: array
+    weights: array | None = None
+    _ids: dict[Any, int] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._ids = {label: i for i, label in enumerate(self.labels)}
+
+    def __len__(self) -> int:
+        return len(self.labels)
+
+    def __contains__(self, label: Any) -> bool:
+        return label in self._ids
+
+    def id(self, label: Any) -> int:
+        """Integer id of a node label (KeyError if absent)."""
+        return self._ids[label]
+
+    def neighbors(self, node: int) -> array:
+        """Target ids of node's out-edges."""
+        return self.targets[self.offsets[node] : self.offsets[node + 1]]
+
+    @property
+    def edge_count(self) -> int:
+        return len(self.targets)
+
+    def path(self, parents: array, goal: Any) -> list[Any]:
+        """
+        Labels along the parent chain ending at goal.
+
+        Args:
+            parents: Parent array returned by bfs or dijkstra
+            goal: Label of the final node
+
+        Returns:
+            List of labels from the search start to goal, or [] if goal
+            was not reached
+        """
+        node = self._ids[goal]
+        if parents[node] == -1:
+            return []
+        path = []
+        while node >= 0:
+            path.append(self.labels[node])
+            node = parents[node]
+        path.reverse()
+        return path
+
+    def bfs(self, start: Any, goal: Any | None = None) -> tuple[array, array]:
+        """
+        Breadth-first search from a labelled node.
+
+        Args:
+            start: Starting label
+            goal: Optional label to stop at once it is dequeued
+
+        Returns:
+            Tuple of (distances, parents) arrays indexed by id; -1 where
+            unreached, parents[start] == -2
+        """
+        offsets, targets = self.offsets, self.targets
+        n = len(self.labels)
+        distances = array("q", [-1]) * n
+        parents = array("q", [-1]) * n
+        source = self._ids[start]
+        target = self._ids[goal] if goal is not None else -1
+        distances[source] = 0
+        parents[source] = -2
+        queue = deque([source])
+
+        while queue:
+            current = queue.popleft()
+            if current == target:
+                break
+            next_distance = distances[current] + 1
+            for neighbor in targets[offsets[current] : offsets[current + 1]]:
+                if distances[neighbor] < 0:
+                    distances[neighbor] = next_distance
+                    parents[neighbor] = current
+                    queue.append(neighbor)
+
+        return distances, parents
+
+    def dfs(self, start: Any, goal: Any) -> list[Any] | None:
+        """
+        Depth-first search for any path between two labels.
+
+        Args:
+            start: Starting label
+            goal: Goal label
+
+        Returns:
+            List of labels from start to goal, or None if no path found
+        """
+        offsets, targets = self.offsets, self.targets
+        n = len(self.labels)
+        visited = bytearray(n)
+        parents = array("q", [-1]) * n
+        target = self._ids.get(goal, -1)
+        stack = [(self._ids[start], -2)]
+
+        while stack:
+            current, parent = stack.pop()
+            if visited[current]:
+                continue
+            visited[current] = 1
+            parents[current] = parent
+            if current == target:
+                return self.path(parents, goal)
+            for neighbor in targets[offsets[current] : offsets[current + 1]]:
+                if not visited[neighbor]:
+                    stack.append((neighbor, current))
+
+        return None
+
+    def dijkstra(self, start: Any, goal: Any | None = None) -> tuple[array, array]:
+        """
+        Dijkstra's shortest paths using edge weights (1 per edge if unweighted).
+
+        Args:
+            start: Starting label
+            goal: Optional label to stop at once it is settled
+
+        Returns:
+            Tuple of (distances, parents) arrays indexed by id; -1 where
+            unreached, parents[start] == -2
+        """
+        offsets, targets, weights = self.offsets, self.targets, self.weights
+        n = len(self.labels)
+        distances = array("q", [-1]) * n
+        parents = array("q", [-1]) * n
+        done = bytearray(n)
+        source = self._ids[start]
+        target = self._ids[goal] if goal is not None else -1
+        distances[source] = 0
+        parents[source] = -2
+        pq = [(0, source)]
+
+        while pq:
+            dist, current = heappop(pq)
+            if done[current]:
+                continue
+            done[current] = 1
+            if current == target:
+                break
+            for k in range(offsets[current], offsets[current + 1]):
+                neighbor = targets[k]
+                new_dist = dist + (weights[k] if weights is not None else 1)
+                if distances[neighbor] < 0 or new_dist < distances[neighbor]:
+                    distances[neighbor] = new_dist
+                    parents[neighbor] = current
+                    heappush(pq, (new_dist, neighbor))
+
+        return distances, parents
+
+    @staticmethod
+    def from_edges(edges: Iterable[tuple], directed: bool = True) -> "CompactGraph":
+        """
+        Build from (u, v) or (u, v, weight) tuples.
+
+        Args:
+            edges: Edge tuples; all must have weights or none
+            directed: If False, add every edge in both directions (default: True)
+
+        Returns:
+            CompactGraph with labels interned in first-seen order
+        """
+        ids: dict[Any, int] = {}
+        sources, targets, weights = array("q"), array("q"), array("q")
+        for edge in edges:
+            u = ids.setdefault(edge[0], len(ids))
+            v = ids.setdefault(edge[1], len(ids))
+            pairs = ((u, v), (v, u)) if not directed else ((u, v),)
+            for a, b in pairs:
+                sources.append(a)
+                targets.append(b)
+                if len(edge) > 2:
+                    weights.append(edge[2])
+        return CompactGraph._from_arrays(list(ids), sources, targets, weights or None)
+
+    @staticmethod
+    def from_adjacency(
+        adjacency: dict[Any, Iterable[Any]], directed: bool = True
+    ) -> "CompactGraph":
+        """
+        Build from a dict mapping each node to its neighbors.
+
+        Args:
+            adjacency: Node -> iterable of neighbor nodes (e.g. from
+                Input.as_adjacency_list or a dict of lists)
+            directed: If False, add every edge in both directions (default: True)
+
+        Returns:
+            CompactGraph; neighbors that never appear as keys become nodes
+            with no out-edges
+        """
+        ids = {node: i for i, node in enumerate(adjacency)}
+        sources, targets = array("q"), array("q")
+        for node, neighbors in adjacency.items():
+            u = ids[node]
+            for neighbor in neighbors:
+                v = ids.setdefault(neighbor, len(ids))
+                sources.append(u)
+                targets.append(v)
+                if not directed:
+                    sources.append(v)
+                    targets.append(u)
+        return CompactGraph._from_arrays(list(ids), sources, targets, None)
+
+    @staticmethod
+    def _from_arrays(
+        labels: list[Any], sources: array, targets: array, weights: array | None
+    ) -> "CompactGraph":
+        # Counting sort of edges by source; keeps input order within a node.
+        n = len(labels)
+        offsets = array("q", [0]) * (n + 1)
+        for u in sources:
+            offsets[u + 1] += 1
+        for i in range(n):
+            offsets[i + 1] += offsets[i]
+
+        slots = offsets[:-1]
+        sorted_targets = array("q", [0]) * len(targets)
+        sorted_weights = array("q", [0]) * len(targets) if weights else None
+        for k, u in enumerate(sources):
+            slot = slots[u]
+            slots[u] = slot + 1
+            sorted_targets[slot] = targets[k]
+            if sorted_weights is not None:
+                sorted_weights[slot] = weights[k]
+        return CompactGraph(labels, offsets, sorted_targets, sorted_weights)
 
 
 __all__ = [
     "bfs",
+    "bfs_multi",
+    "bfs_layers",
+    "bfs_indexed",
+    "bidirectional_bfs",
     "dfs",
     "bfs_grid_path",
     "dfs_grid_path",
+    "bfs_padded_path",
     "flood_fill",
+    "flood_fill_padded",
     "flood_fill_mark",
     "dijkstra",
+    "dijkstra_buckets",
+    "bfs_01",
+    "astar",
+    "manhattan_heuristic",
+    "chebyshev_heuristic",
     "count_paths_dag",
+    "PathCounter",
+    "count_paths_via",
     "count_paths_cyclic",
     "find_max_clique",
+    "heap_ordered",
+    "kruskal",
     "UnionFind",
+    "CompactGraph",
 ]
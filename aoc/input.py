@@ -44,6 +44,8 @@ Supported Parsing Scenarios
 
     Example: ``"kh-tc\\ntc-wh\\nwh-yn"`` → ``{'kh': {'tc'}, 'tc': {'kh', 'wh'}, ...}``
 
+    Use ``as_compact_graph()`` for the same input as a CSR ``CompactGraph``.
+
 **Dense single-line string** - ``.content``
     Access raw content string for character-by-character processing.
 
@@ -114,7 +116,8 @@ Input
 
 from collections import defaultdict
 from re import findall, error, search
-from .d2 import Coord, Grid
+from .d2 import ArrayGrid, BitGrid, Coord, Grid
+from .graph import CompactGraph
 
 
 def extract_ints(text: str, pattern: str = r"-?\d+") -> list[int]:
@@ -421,12 +424,13 @@ class Input:
         """
         return self.parse(self._line_sep, skip_empty=skip_empty)
 
-    def as_grid(self, converter: type | None = None) -> Grid:
+    def as_grid(self, converter: type | None = None, compact: bool = False) -> Grid:
         """
         Parse content as 2D character grid.
 
         Args:
             converter: Optional type function to apply to each character
+            compact: Return an ArrayGrid backed by flat storage (default: False)
 
         Returns:
             Grid instance wrapping character grid
@@ -439,11 +443,37 @@ class Input:
             With converter:
             >>> Input.from_string("abc\\ndef").as_grid(converter=str.upper)
             Grid([['A', 'B', 'C'], ['D', 'E', 'F']])
+
+            Compact storage:
+            >>> Input.from_string("ABC\\nDEF").as_grid(compact=True)
+            ArrayGrid(data=bytearray(b'ABCDEF'), width=3)
         """
+        if compact:
+            if converter is None:
+                return ArrayGrid.from_rows(self.as_lines())
+            return ArrayGrid.from_rows(
+                [[converter(char) for char in line] for line in self.as_lines()]
+            )
         if converter is None:
             return Grid([list(line) for line in self.as_lines()])
         return Grid([[converter(char) for char in line] for line in self.as_lines()])
 
+    def as_bit_grid(self, true_chars: str = "#") -> BitGrid:
+        """
+        Parse content as a bit-packed boolean grid.
+
+        Args:
+            true_chars: Characters that become set bits (default: "#")
+
+        Returns:
+            BitGrid with one int per row
+
+        Example:
+            >>> Input.from_string("#.\\n.#").as_bit_grid().find_all()
+            [Coord(x=0, y=0), Coord(x=1, y=1)]
+        """
+        return BitGrid.from_grid(ArrayGrid.from_rows(self.as_lines()), set(true_chars))
+
     def as_int_grid(self, empty_value: int = -1) -> Grid:
         """
         Parse content as 2D integer grid (digit characters only).
@@ -585,6 +615,37 @@ class Input:
 
         return dict(graph)
 
+    def as_compact_graph(
+        self, separator: str = "-", directed: bool = False
+    ) -> CompactGraph:
+        """
+        Parse "A-B" edge lines straight into a CSR CompactGraph.
+
+        Same input format and edges as as_adjacency_list (one "A-B" pair
+        per line, repeated edges kept once), without building the
+        intermediate dict of sets.
+
+        Args:
+            separator: Delimiter between nodes (default: "-")
+            directed: If False, create bidirectional edges (default: False)
+
+        Returns:
+            CompactGraph with node labels in first-seen order
+
+        Example:
+            >>> graph = Input.from_string("A-B\\nB-C").as_compact_graph()
+            >>> graph.labels, graph.edge_count
+            (['A', 'B', 'C'], 4)
+        """
+        arcs: dict[tuple[str, str], None] = {}
+        for line in self.as_lines():
+            node1, node2 = line.split(separator)
+            arcs[node1, node2] = None
+            if not directed:
+                arcs[node2, node1] = None
+
+        return CompactGraph.from_edges(arcs)
+
     def as_delimited_lines(
         self, separator: str = ",", converter: type = int
     ) -> list[list]: